@@ -1,13 +1,16 @@
 """Agent modules for multi-agent research system."""
 
 from .planner import planner_node
-from .researcher import researcher_node
-from .writer import writer_node
+from .researcher import SearchResults, empty_results, researcher_node
+from .writer import writer_node, writer_node_batch
 from .reviewer import reviewer_node
 
 __all__ = [
     "planner_node",
     "researcher_node",
+    "SearchResults",
+    "empty_results",
     "writer_node",
+    "writer_node_batch",
     "reviewer_node",
 ]
@@ -1,27 +1,78 @@
 """Planner agent - decomposes research queries into focused steps."""
 
-import json
-from typing import Any
+import re
+from functools import lru_cache
+from typing import Any, Optional
 
 from langchain.schema import AIMessage
-from langchain_core.output_parsers import StrOutputParser
 from langchain_core.prompts import ChatPromptTemplate
+from pydantic import BaseModel, Field
 
-from providers import get_llm
+from providers import cache_scope, cacheable_system_message, cached_invoke, get_llm
 
+# Single focused questions ("What is X?", "Define Y") need no decomposition
+_ATOMIC_MAX_WORDS = 12
+_ATOMIC_PREFIX_RE = re.compile(
+    r"^\s*(what(\s+is|\s+was|'s)|who\s+(is|was)|when|where|define)\b",
+    re.IGNORECASE,
+)
+_COMPOUND_RE = re.compile(r"\b(and|or|vs\.?|versus|compare[ds]?|comparison)\b", re.IGNORECASE)
 
-def planner_node(state: dict[str, Any]) -> dict[str, Any]:
+# Static instructions go first so providers can cache the prompt prefix
+_SYSTEM_PROMPT = (
+    "You are a research planner. Given a research query, decompose it into "
+    "2-5 focused, actionable research steps that will help answer the question. "
+    "Each step should be a specific aspect to investigate."
+)
+
+
+class Plan(BaseModel):
+    """Research plan returned by the planner LLM via tool calling."""
+
+    steps: list[str] = Field(
+        min_length=2,
+        max_length=5,
+        description="Focused, actionable research steps",
+    )
+
+
+@lru_cache(maxsize=None)
+def _prompt(provider: Optional[str]) -> ChatPromptTemplate:
+    """Build the planner prompt once per provider (system message varies)."""
+    return ChatPromptTemplate.from_messages([
+        cacheable_system_message(_SYSTEM_PROMPT, provider),
+        (
+            "human",
+            "Research query: {query}\n\n"
+            "Generate 2-5 research steps:"
+        ),
+    ])
+
+
+def _is_atomic(query: str) -> bool:
+    """Return True for short single-fact questions that need no planning."""
+    return (
+        len(query.split()) < _ATOMIC_MAX_WORDS
+        and _ATOMIC_PREFIX_RE.match(query) is not None
+        and _COMPOUND_RE.search(query) is None
+    )
+
+
+async def planner_node(state: dict[str, Any]) -> dict[str, Any]:
     """
     Generate 2-5 focused research steps from user query.
 
     Uses LLM to break down complex queries into actionable research steps.
     Extended thinking is automatically used for Claude 3.7+/Sonnet 4+ models.
+    Short atomic questions skip the LLM and are researched directly, and
+    plans for semantically similar queries are served from cache.
 
     Args:
         state: Research state containing:
             - query: User's research question
             - llm_provider: LLM provider to use
             - model_name: Model identifier
+            - force_refresh: Skip cached plans
 
     Returns:
         State updates with:
@@ -30,10 +81,16 @@ def planner_node(state: dict[str, Any]) -> dict[str, Any]:
 
     Example:
         >>> state = {"query": "impact of AI on jobs", "llm_provider": "anthropic"}
-        >>> result = planner_node(state)
+        >>> result = await planner_node(state)
         >>> result["plan"]
         ['Current AI adoption rates by industry', 'Jobs displaced by automation', ...]
     """
+    if _is_atomic(state["query"]):
+        return {
+            "plan": [state["query"]],
+            "messages": [AIMessage(content="Atomic query, skipping planner")],
+        }
+
     try:
         llm = get_llm(
             provider=state.get("llm_provider"),
@@ -46,42 +103,21 @@ def planner_node(state: dict[str, Any]) -> dict[str, Any]:
             "messages": [AIMessage(content=f"⚠️  Planner error: {str(e)}")],
         }
 
-    prompt = ChatPromptTemplate.from_messages([
-        (
-            "system",
-            "You are a research planner. Given a research query, decompose it into "
-            "2-5 focused, actionable research steps that will help answer the question. "
-            "Each step should be a specific aspect to investigate.\n\n"
-            "Return ONLY a JSON array of strings, nothing else. No explanations.\n\n"
-            "Example: [\"Step 1 description\", \"Step 2 description\", \"Step 3 description\"]"
-        ),
-        (
-            "human",
-            "Research query: {query}\n\n"
-            "Generate 2-5 research steps as a JSON array:"
-        ),
-    ])
-
-    chain = prompt | llm | StrOutputParser()
+    # Tool calling makes the provider return the Plan schema directly, so
+    # there is no free-form JSON to parse (and no wrong-shape fallback)
+    chain = _prompt(state.get("llm_provider")) | llm.with_structured_output(Plan, method="function_calling")
 
     try:
-        response = chain.invoke({"query": state["query"]})
-
-        # Try to parse JSON response
-        try:
-            plan = json.loads(response)
-
-            # Validate plan structure
-            if not isinstance(plan, list) or len(plan) < 2 or len(plan) > 5:
-                plan = [state["query"]]  # Fallback to original query
-
-            # Ensure all items are strings
-            plan = [str(step) for step in plan]
-
-        except json.JSONDecodeError:
-            # If JSON parsing fails, try to extract steps from text
-            lines = [line.strip() for line in response.split("\n") if line.strip()]
-            plan = lines[:5] if lines else [state["query"]]
+        # Near-duplicate queries ("AI impact on jobs" / "How does AI affect
+        # employment") reuse an earlier plan from the same model instead of
+        # calling the LLM again
+        plan = list((await cached_invoke(
+            chain,
+            "planner",
+            {"query": state["query"]},
+            scope=cache_scope(state.get("llm_provider"), state.get("model_name")),
+            lookup=not state.get("force_refresh", False),
+        )).steps)
 
         return {
             "plan": plan,
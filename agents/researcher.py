@@ -1,87 +1,229 @@
 """Researcher agent - executes searches and collects results."""
 
-import time
-from typing import Any
+import re
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Any, TypedDict
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
 
 from langchain.schema import AIMessage
 
-from providers import search
+from providers import BATCH_PROVIDERS, search, search_batch
+
+# Upper bound on in-flight searches so providers aren't hit with a burst
+MAX_CONCURRENT_SEARCHES = 5
+
+# The writer only cites this many sources, so don't carry more in state
+MAX_RESULTS_FOR_WRITER = 20
+
+# Query parameters that only track the click and never change the page
+_TRACKING_PARAMS = {"fbclid", "gclid", "msclkid", "ref", "ref_src"}
+
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
+class SearchResults(TypedDict):
+    """
+    Search results stored column-wise, as parallel lists.
+
+    Entry i of every list belongs to result i, so the state holds four lists
+    instead of one dict per result.
+    """
+    title: list[str]
+    url: list[str]
+    snippet: list[str]
+    step_index: list[int]
+
+
+def empty_results() -> SearchResults:
+    """Return a SearchResults with no entries."""
+    return {"title": [], "url": [], "snippet": [], "step_index": []}
+
+
+def _normalize_step(step: str) -> str:
+    """Reduce a plan step to a search key (case and whitespace insensitive)."""
+    return _WHITESPACE_RE.sub(" ", step.strip().lower())
+
+
+@lru_cache(maxsize=4096)
+def _normalize_url(url: str) -> str:
+    """
+    Reduce a URL to a dedup key so trivially different links match.
+
+    Lowercases scheme and host, drops the fragment, tracking parameters
+    (utm_*, gclid, ...) and a trailing slash. Other query parameters are
+    kept since they often identify distinct pages (e.g. ?id=123).
+
+    Memoized: URL parsing dominates the dedup loop, and the same URLs
+    recur across steps, revisions and repeated queries.
+    """
+    parts = urlsplit(url.strip())
+    query = urlencode([
+        (key, value) for key, value in parse_qsl(parts.query, keep_blank_values=True)
+        if not key.lower().startswith("utm_") and key.lower() not in _TRACKING_PARAMS
+    ])
+    path = parts.path.rstrip("/")
+    return urlunsplit((parts.scheme.lower(), parts.netloc.lower(), path, query, ""))
+
+
+def _search_batched(
+    unique_steps: dict[str, str],
+    provider: str,
+    num_results: int,
+    refresh: bool = False,
+) -> dict[str, list[dict]]:
+    """Search all steps with one batch request, keyed like unique_steps."""
+    try:
+        batch = search_batch(
+            list(unique_steps.values()), provider=provider, num_results=num_results, refresh=refresh
+        )
+    except ValueError:
+        raise
+    except Exception as e:
+        print(f"⚠️  Batch search failed: {e}")
+        batch = [[] for _ in unique_steps]
+
+    return dict(zip(unique_steps, batch))
+
+
+def _search_concurrently(
+    unique_steps: dict[str, str],
+    provider: str,
+    num_results: int,
+    refresh: bool = False,
+) -> dict[str, list[dict]]:
+    """
+    Search each step on a thread pool, keyed like unique_steps.
+
+    Raises:
+        ValueError: On a provider configuration error
+    """
+    # Fire all step searches at once; futures keep plan order for collection
+    with ThreadPoolExecutor(max_workers=min(len(unique_steps), MAX_CONCURRENT_SEARCHES)) as pool:
+        futures = {
+            key: pool.submit(
+                search,
+                query=step,
+                provider=provider,
+                num_results=num_results,
+                refresh=refresh,
+            )
+            for key, step in unique_steps.items()
+        }
+
+    searched = {}
+    for key, future in futures.items():
+        try:
+            searched[key] = future.result()
+
+        except ValueError:
+            raise
+
+        except Exception as e:
+            # Individual search failure - continue with other steps
+            print(f"⚠️  Search failed for step '{unique_steps[key]}': {e}")
+            searched[key] = []
+
+    return searched
 
 
 def researcher_node(state: dict[str, Any]) -> dict[str, Any]:
     """
     Execute searches for each research step and collect results.
 
-    Performs search queries for each step in the plan, normalizes results,
-    and handles errors gracefully. Deduplicates URLs across all results.
+    Runs the searches for all plan steps concurrently (bounded by
+    MAX_CONCURRENT_SEARCHES), or as a single request for providers with a
+    batch API (BATCH_PROVIDERS), searching steps that differ only in case
+    or whitespace once. Then normalizes results in plan order and
+    handles errors gracefully. Deduplicates URLs across all results,
+    treating links that differ only in tracking parameters, fragment,
+    host case or trailing slash as the same source. Keeps at most
+    MAX_RESULTS_FOR_WRITER results, taken round-robin across steps.
 
     Args:
         state: Research state containing:
             - plan: List of research steps
             - search_provider: Search provider to use
             - num_results: Results per step
+            - force_refresh: Bypass the search cache
 
     Returns:
         State updates with:
-            - results: List of search result dicts with keys:
+            - results: SearchResults, parallel lists keyed
                       title, url, snippet, step_index
+                      (ordered by rank, interleaving steps)
             - messages: List with researcher's message
 
     Example:
         >>> state = {"plan": ["AI adoption rates", "Job displacement"]}
         >>> result = researcher_node(state)
-        >>> len(result["results"])
+        >>> len(result["results"]["url"])
         10  # 5 results per step * 2 steps
     """
     plan = state.get("plan", [])
     search_provider = state.get("search_provider", "duckduckgo")
     num_results = state.get("num_results", 5)
+    refresh = state.get("force_refresh", False)
 
     if not plan:
         return {
-            "results": [],
+            "results": empty_results(),
             "messages": [AIMessage(content="⚠️  No research plan to execute")],
         }
 
-    all_results = []
-    seen_urls = set()
+    # Duplicate steps map to the first occurrence so each is searched once
+    unique_steps = {}
+    for step in plan:
+        unique_steps.setdefault(_normalize_step(step), step)
 
-    for idx, step in enumerate(plan):
-        try:
-            # Execute search for this step
-            step_results = search(
-                query=step,
-                provider=search_provider,
-                num_results=num_results,
-            )
+    try:
+        if search_provider in BATCH_PROVIDERS:
+            searched = _search_batched(unique_steps, search_provider, num_results, refresh)
+        else:
+            searched = _search_concurrently(unique_steps, search_provider, num_results, refresh)
 
-            # Add step index and deduplicate
-            for result in step_results:
-                url = result.get("url", "")
-                if url and url not in seen_urls:
-                    result["step_index"] = idx
-                    all_results.append(result)
-                    seen_urls.add(url)
-
-            # Rate limiting - be nice to search providers
-            if idx < len(plan) - 1:  # Don't sleep after last step
-                time.sleep(0.5)
-
-        except ValueError as e:
-            # Provider configuration error
-            return {
-                "results": [],
-                "messages": [AIMessage(content=f"⚠️  Search configuration error: {str(e)}")],
-            }
+    except ValueError as e:
+        # Provider configuration error
+        return {
+            "results": empty_results(),
+            "messages": [AIMessage(content=f"⚠️  Search configuration error: {str(e)}")],
+        }
 
-        except Exception as e:
-            # Individual search failure - continue with other steps
-            print(f"⚠️  Search failed for step '{step}': {e}")
+    # Remap to plan order so dedup is deterministic
+    step_results = [searched[_normalize_step(step)] for step in plan]
+
+    # Interleave steps rank by rank (every step's top hit first) so no
+    # single step crowds out the others once the writer's cap is reached
+    ranked = (
+        (idx, results[rank])
+        for rank in range(max(len(results) for results in step_results))
+        for idx, results in enumerate(step_results)
+        if rank < len(results)
+    )
+
+    all_results = empty_results()
+    seen_urls = set()
+
+    # Add step index and deduplicate
+    for idx, result in ranked:
+        if len(all_results["url"]) >= MAX_RESULTS_FOR_WRITER:
+            break
+
+        url = result.get("url", "")
+        if not url:
             continue
 
-    if not all_results:
+        key = _normalize_url(url)
+        if key not in seen_urls:
+            all_results["title"].append(result.get("title", ""))
+            all_results["url"].append(url)
+            all_results["snippet"].append(result.get("snippet", ""))
+            all_results["step_index"].append(idx)
+            seen_urls.add(key)
+
+    if not all_results["url"]:
         return {
-            "results": [],
+            "results": empty_results(),
             "messages": [AIMessage(content="⚠️  No search results found for any step")],
         }
 
@@ -89,7 +231,7 @@ def researcher_node(state: dict[str, Any]) -> dict[str, Any]:
         "results": all_results,
         "messages": [
             AIMessage(
-                content=f"Found {len(all_results)} unique results across {len(plan)} research steps"
+                content=f"Found {len(all_results['url'])} unique results across {len(plan)} research steps"
             )
         ],
     }
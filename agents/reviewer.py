@@ -1,37 +1,79 @@
 """Reviewer agent - validates citations and triggers revisions."""
 
-from typing import Any
+import re
+from functools import lru_cache
+from typing import Any, Optional
 
 from langchain.schema import AIMessage
 from langchain_core.output_parsers import StrOutputParser
 from langchain_core.prompts import ChatPromptTemplate
 
-from providers import get_llm
+from providers import cache_scope, cacheable_system_message, cached_invoke, get_llm
 
+_NEEDS_REVISION_RE = re.compile(r"NEEDS_REVISION", re.IGNORECASE)
+_CITATION_RE = re.compile(r"\[(\d+)\]")
 
-def reviewer_node(state: dict[str, Any]) -> dict[str, Any]:
+# Static instructions go first so providers can cache the prompt prefix
+_SYSTEM_PROMPT = (
+    "You are a fact-checker reviewing research briefs. Your job is to verify "
+    "that all factual claims have proper inline citations [1][2][3].\n\n"
+    "Review the brief and respond with EXACTLY ONE of:\n"
+    "- 'APPROVED' if all claims are properly cited\n"
+    "- 'NEEDS_REVISION: <specific reason>' if citations are missing or inadequate\n\n"
+    "Be strict but fair. Every factual statement needs a citation."
+)
+
+
+def _citations_valid(draft: str, num_references: int) -> bool:
+    """True if the draft cites at least one source and every [n] is a real reference."""
+    cites = {int(n) for n in _CITATION_RE.findall(draft)}
+    return bool(cites) and min(cites) >= 1 and max(cites) <= num_references
+
+
+@lru_cache(maxsize=None)
+def _prompt(provider: Optional[str]) -> ChatPromptTemplate:
+    """Build the reviewer prompt once per provider (system message varies)."""
+    return ChatPromptTemplate.from_messages([
+        cacheable_system_message(_SYSTEM_PROMPT, provider),
+        (
+            "human",
+            "Review this research brief:\n\n{draft}\n\n"
+            "Provide your assessment (APPROVED or NEEDS_REVISION):"
+        ),
+    ])
+
+
+async def reviewer_node(state: dict[str, Any]) -> dict[str, Any]:
     """
     Validate that all factual claims have proper citations.
 
     Reviews the draft to ensure all claims are properly cited.
-    Triggers one revision if issues are found, then finalizes output.
+    Drafts whose [n] citations are all present and in range are approved
+    without an LLM call. Otherwise the LLM reviews the draft and triggers
+    one revision if issues are found, then finalizes output; the revised
+    draft is finalized without another LLM review. Verdicts are cached
+    per exact draft text.
 
     Args:
         state: Research state containing:
             - draft: Written brief with citations
+            - references: Source URLs the citations index into
             - revised_once: Whether revision has been done
             - llm_provider: LLM provider to use
             - model_name: Model identifier
+            - force_refresh: Skip cached verdicts
 
     Returns:
         State updates with either:
             - revised_once: True (triggers revision loop)
             - final: Approved draft text
+            and always:
+            - needs_revision: Whether the writer should revise the draft
             - messages: List with reviewer's message
 
     Example:
         >>> state = {"draft": "AI is growing [1].", "revised_once": False}
-        >>> result = reviewer_node(state)
+        >>> result = await reviewer_node(state)
         >>> "final" in result or "revised_once" in result
         True
     """
@@ -41,9 +83,27 @@ def reviewer_node(state: dict[str, Any]) -> dict[str, Any]:
     if not draft:
         return {
             "final": "No draft available.",
+            "needs_revision": False,
             "messages": [AIMessage(content="⚠️  No draft to review")],
         }
 
+    # After the one allowed revision the verdict can't change the outcome,
+    # so skip the LLM call and finalize directly
+    if revised_once:
+        return {
+            "final": draft,
+            "needs_revision": False,
+            "messages": [AIMessage(content="Revision limit reached, finalizing")],
+        }
+
+    # Well-formed citations are the common case and can be checked locally
+    if _citations_valid(draft, len(state.get("references", []))):
+        return {
+            "final": draft,
+            "needs_revision": False,
+            "messages": [AIMessage(content="Citations valid, research complete")],
+        }
+
     try:
         llm = get_llm(
             provider=state.get("llm_provider"),
@@ -53,58 +113,47 @@ def reviewer_node(state: dict[str, Any]) -> dict[str, Any]:
         # If we can't get LLM, approve the draft as-is
         return {
             "final": draft,
+            "needs_revision": False,
             "messages": [AIMessage(content=f"⚠️  Reviewer unavailable, auto-approving: {str(e)}")],
         }
 
-    prompt = ChatPromptTemplate.from_messages([
-        (
-            "system",
-            "You are a fact-checker reviewing research briefs. Your job is to verify "
-            "that all factual claims have proper inline citations [1][2][3].\n\n"
-            "Review the brief and respond with EXACTLY ONE of:\n"
-            "- 'APPROVED' if all claims are properly cited\n"
-            "- 'NEEDS_REVISION: <specific reason>' if citations are missing or inadequate\n\n"
-            "Be strict but fair. Every factual statement needs a citation."
-        ),
-        (
-            "human",
-            "Review this research brief:\n\n{draft}\n\n"
-            "Provide your assessment (APPROVED or NEEDS_REVISION):"
-        ),
-    ])
-
-    chain = prompt | llm | StrOutputParser()
+    chain = _prompt(state.get("llm_provider")) | llm | StrOutputParser()
 
     try:
-        review = chain.invoke({"draft": draft})
+        # A verdict only applies to the exact draft (and model) it was given
+        review = await cached_invoke(
+            chain,
+            "reviewer",
+            {"draft": draft},
+            scope=cache_scope(state.get("llm_provider"), state.get("model_name"), draft),
+            lookup=not state.get("force_refresh", False),
+        )
 
-        # Check if revision is needed and allowed
-        needs_revision = "NEEDS_REVISION" in review.upper()
+        # Check if revision is needed
+        needs_revision = bool(_NEEDS_REVISION_RE.search(review))
 
-        if needs_revision and not revised_once:
+        if needs_revision:
             # Trigger one revision
             return {
                 "revised_once": True,
+                "needs_revision": True,
                 "messages": [
                     AIMessage(content=f"Requesting revision: {review}")
                 ],
             }
 
-        # Either approved or already revised once - finalize
+        # Approved - finalize
         return {
             "final": draft,
-            "messages": [
-                AIMessage(
-                    content="Research complete" if not needs_revision
-                    else "Revision limit reached, finalizing"
-                )
-            ],
+            "needs_revision": False,
+            "messages": [AIMessage(content="Research complete")],
         }
 
     except Exception as e:
         # On error, approve draft to prevent blocking
         return {
             "final": draft,
+            "needs_revision": False,
             "messages": [
                 AIMessage(content=f"⚠️  Review failed, auto-approving: {str(e)}")
             ],
@@ -1,27 +1,120 @@
 """Writer agent - synthesizes research findings into brief with citations."""
 
+import asyncio
+import html
+import io
 from typing import Any
 
 from langchain.schema import AIMessage
-from langchain_core.output_parsers import StrOutputParser
+from langchain_core.output_parsers import PydanticOutputParser, StrOutputParser
 from langchain_core.prompts import ChatPromptTemplate
+from pydantic import BaseModel, Field
 
-from providers import get_llm
+from providers import cache_scope, cached_invoke, get_llm
 
+from .researcher import MAX_RESULTS_FOR_WRITER, SearchResults
 
-def writer_node(state: dict[str, Any]) -> dict[str, Any]:
+# Beyond this, titles and snippets are mostly boilerplate that only adds
+# prompt tokens
+MAX_TITLE_CHARS = 120
+MAX_SNIPPET_CHARS = 160
+
+_REQUIREMENTS = (
+    "CRITICAL REQUIREMENTS:\n"
+    "1. Include inline citations [1][2][3] for ALL factual claims\n"
+    "2. Stay under 200 words - be concise and focused\n"
+    "3. Answer the research question directly\n"
+    "4. Use clear, professional language\n"
+    "5. Only cite sources that are actually provided\n\n"
+)
+
+
+class _BatchDraft(BaseModel):
+    """One brief within a batched writer response."""
+
+    i: int = Field(description="Index of the research question this brief answers")
+    text: str = Field(description="The brief with inline citations")
+
+
+class _BatchDrafts(BaseModel):
+    """Batched writer response: one brief per research question."""
+
+    drafts: list[_BatchDraft]
+
+
+_PROMPT = ChatPromptTemplate.from_messages([
+    (
+        "system",
+        "You are a research writer specializing in synthesizing information. "
+        "Your task is to write a concise research brief (≤200 words) that answers "
+        "the research question using the provided sources.\n\n"
+        + _REQUIREMENTS
+        + "Write ONLY the brief, no preamble or meta-commentary."
+    ),
+    (
+        "human",
+        "Research Question: {query}\n\n"
+        "Sources:\n{results}\n\n"
+        "Write a ≤200-word research brief with inline citations:"
+    ),
+])
+
+_BATCH_PARSER = PydanticOutputParser(pydantic_object=_BatchDrafts)
+_BATCH_PROMPT = ChatPromptTemplate.from_messages([
+    (
+        "system",
+        "You are a research writer specializing in synthesizing information. "
+        "For EACH research question below, write a concise research brief "
+        "(≤200 words) that answers it using only that question's sources. "
+        "Citation numbers refer to the sources listed for the same question.\n\n"
+        + _REQUIREMENTS
+        + "{format_instructions}"
+    ),
+    (
+        "human",
+        "{questions}\n\n"
+        "Write one ≤200-word brief with inline citations per research question:"
+    ),
+]).partial(format_instructions=_BATCH_PARSER.get_format_instructions())
+
+
+def _top_sources(results: SearchResults) -> SearchResults:
+    """Limit results to the MAX_RESULTS_FOR_WRITER sources the writer cites."""
+    return {key: values[:MAX_RESULTS_FOR_WRITER] for key, values in results.items()}
+
+
+def _format_sources(top: SearchResults) -> str:
+    """
+    Format results as numbered source blocks for the writer prompt.
+
+    HTML entities are decoded and titles/snippets are truncated to
+    MAX_TITLE_CHARS/MAX_SNIPPET_CHARS to keep the prompt small.
+    """
+    buf = io.StringIO()
+    for i, (title, url, snippet) in enumerate(zip(top["title"], top["url"], top["snippet"]), 1):
+        title = html.unescape(title or "")[:MAX_TITLE_CHARS]
+        snippet = html.unescape(snippet or "")[:MAX_SNIPPET_CHARS]
+        if i > 1:
+            buf.write("\n\n")
+        buf.write(f"[{i}] {title}\nURL: {url}\nContent: {snippet}")
+    return buf.getvalue()
+
+
+async def writer_node(state: dict[str, Any]) -> dict[str, Any]:
     """
     Synthesize research findings into concise brief with inline citations.
 
     Creates a ≤200-word summary with inline citations [1][2][3] for all
-    factual claims. Generates deduplicated references list.
+    factual claims. Builds the references list in citation order. Drafts for a
+    semantically similar query over the same source URLs are served from cache.
 
     Args:
         state: Research state containing:
             - query: Original research question
-            - results: List of search results
+            - results: Search results (SearchResults)
             - llm_provider: LLM provider to use
             - model_name: Model identifier
+            - force_refresh: Skip cached drafts
 
     Returns:
         State updates with:
@@ -30,21 +123,26 @@ def writer_node(state: dict[str, Any]) -> dict[str, Any]:
             - messages: List with writer's message
 
     Example:
-        >>> state = {"query": "AI impact", "results": [...]}
-        >>> result = writer_node(state)
+        >>> state = {"query": "AI impact", "results": {"title": [...], "url": [...], ...}}
+        >>> result = await writer_node(state)
         >>> "[1]" in result["draft"]
         True
     """
     query = state.get("query", "")
-    results = state.get("results", [])
+    results = state.get("results") or {}
 
-    if not results:
+    if not results.get("url"):
         return {
             "draft": "No research results available to synthesize.",
             "references": [],
             "messages": [AIMessage(content="⚠️  No results to write about")],
         }
 
+    top = _top_sources(results)  # Limit context to the top sources
+
+    # Researcher already deduplicated URLs, so references follow result order
+    references = [url for url in top["url"] if url]
+
     try:
         llm = get_llm(
             provider=state.get("llm_provider"),
@@ -57,56 +155,26 @@ def writer_node(state: dict[str, Any]) -> dict[str, Any]:
             "messages": [AIMessage(content=f"⚠️  Writer error: {str(e)}")],
         }
 
-    # Format research results for LLM
-    results_text = "\n\n".join([
-        f"[{i+1}] {r['title']}\n"
-        f"URL: {r['url']}\n"
-        f"Content: {r['snippet']}"
-        for i, r in enumerate(results[:20])  # Limit to top 20 for context
-    ])
-
-    prompt = ChatPromptTemplate.from_messages([
-        (
-            "system",
-            "You are a research writer specializing in synthesizing information. "
-            "Your task is to write a concise research brief (≤200 words) that answers "
-            "the research question using the provided sources.\n\n"
-            "CRITICAL REQUIREMENTS:\n"
-            "1. Include inline citations [1][2][3] for ALL factual claims\n"
-            "2. Stay under 200 words - be concise and focused\n"
-            "3. Answer the research question directly\n"
-            "4. Use clear, professional language\n"
-            "5. Only cite sources that are actually provided\n\n"
-            "Write ONLY the brief, no preamble or meta-commentary."
-        ),
-        (
-            "human",
-            "Research Question: {query}\n\n"
-            "Sources:\n{results}\n\n"
-            "Write a ≤200-word research brief with inline citations:"
-        ),
-    ])
-
-    chain = prompt | llm | StrOutputParser()
+    results_text = _format_sources(top)
 
-    try:
-        draft = chain.invoke({
-            "query": query,
-            "results": results_text,
-        })
+    chain = _PROMPT | llm | StrOutputParser()
 
-        # Extract unique references in order
-        references = []
-        seen_urls = set()
-
-        for result in results[:20]:
-            url = result.get("url", "")
-            if url and url not in seen_urls:
-                references.append(url)
-                seen_urls.add(url)
+    try:
+        # Drafts are reused only for similar queries over the same sources in
+        # the same order (citation numbers index into the references), from
+        # the same model. A revision pass must produce a fresh draft, not
+        # the one just rejected
+        draft = (await cached_invoke(
+            chain,
+            "writer",
+            {"query": query, "results": results_text},
+            key=query,
+            scope=cache_scope(state.get("llm_provider"), state.get("model_name"), *references),
+            lookup=not (state.get("revised_once", False) or state.get("force_refresh", False)),
+        )).strip()
 
         return {
-            "draft": draft.strip(),
+            "draft": draft,
             "references": references,
             "messages": [
                 AIMessage(content=f"Draft complete with {len(references)} references")
@@ -119,3 +187,81 @@ def writer_node(state: dict[str, Any]) -> dict[str, Any]:
             "references": [],
             "messages": [AIMessage(content=f"⚠️  Writing failed: {str(e)}")],
         }
+
+
+async def writer_node_batch(states: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    """
+    Synthesize briefs for several research states with a single LLM call.
+
+    Packs every state's question and sources into one prompt and parses a
+    JSON array of drafts, so the system prompt and instructions are paid
+    for once per batch instead of once per query. States without results,
+    and any draft missing from the parsed response, fall back to writer_node.
+
+    Args:
+        states: Research states (same LLM configuration) each containing:
+            - query: Original research question
+            - results: Search results (SearchResults)
+            - llm_provider: LLM provider to use
+            - model_name: Model identifier
+
+    Returns:
+        One state update per input state, in order, shaped like writer_node's
+
+    Example:
+        >>> updates = await writer_node_batch([state_a, state_b])
+        >>> [u["draft"] for u in updates]
+        ['AI adoption grew [1]...', 'Fusion output reached [2]...']
+    """
+    pending = [i for i, state in enumerate(states) if (state.get("results") or {}).get("url")]
+    if len(pending) < 2:
+        return list(await asyncio.gather(*(writer_node(state) for state in states)))
+
+    try:
+        llm = get_llm(
+            provider=states[0].get("llm_provider"),
+            model_name=states[0].get("model_name"),
+        )
+    except ValueError:
+        # writer_node reports the configuration error per state
+        return list(await asyncio.gather(*(writer_node(state) for state in states)))
+
+    tops = {i: _top_sources(states[i]["results"]) for i in pending}
+    questions_text = "\n\n".join(
+        f"### Research question {i}: {states[i].get('query', '')}\n\n"
+        f"Sources for question {i}:\n{_format_sources(tops[i])}"
+        for i in pending
+    )
+
+    chain = _BATCH_PROMPT | llm | _BATCH_PARSER
+
+    try:
+        parsed = await chain.ainvoke({"questions": questions_text})
+        drafts = {d.i: d.text.strip() for d in parsed.drafts if d.text.strip()}
+    except Exception as e:
+        print(f"⚠️  Batched writing failed, drafting individually: {e}")
+        drafts = {}
+
+    # Anything the batch didn't cover is drafted individually, concurrently
+    fallbacks = {
+        i: writer_node(state) for i, state in enumerate(states)
+        if i not in drafts or i not in tops
+    }
+    fallback_updates = dict(zip(fallbacks, await asyncio.gather(*fallbacks.values())))
+
+    updates = []
+    for i in range(len(states)):
+        if i in fallback_updates:
+            updates.append(fallback_updates[i])
+            continue
+
+        references = [url for url in tops[i]["url"] if url]
+        updates.append({
+            "draft": drafts[i],
+            "references": references,
+            "messages": [
+                AIMessage(content=f"Draft complete with {len(references)} references (batched)")
+            ],
+        })
+
+    return updates
@@ -2,18 +2,22 @@
 """Gradio web interface for multi-agent research system."""
 
 import os
-from typing import Optional
+from typing import AsyncIterator, Optional
 
 import gradio as gr
 from dotenv import load_dotenv
 
-from providers.llm import get_available_models
+from providers.llm import get_available_models, get_llm
 from providers.search import get_available_providers
-from workflow import run_research
+from workflow import stream_research
 
 # Load environment variables
 load_dotenv()
 
+# Initial dropdown selections (also what the startup warmup targets)
+DEFAULT_LLM_PROVIDER = "Anthropic"
+DEFAULT_MODEL = "claude-sonnet-4-5-20250929"
+
 
 def format_output(state: dict) -> tuple[str, str, str]:
     """
@@ -34,8 +38,8 @@ def format_output(state: dict) -> tuple[str, str, str]:
     else:
         plan_md += "_No plan generated_\n"
 
-    # Format brief
-    brief = state.get("final", state.get("draft", ""))
+    # Format brief (partial draft while the writer is still streaming)
+    brief = state.get("final") or state.get("draft", "")
     brief_md = "## 📝 Research Brief\n\n"
     if brief:
         brief_md += brief
@@ -54,15 +58,16 @@ def format_output(state: dict) -> tuple[str, str, str]:
     return plan_md, brief_md, references_md
 
 
-def research_interface(
+async def research_interface(
     query: str,
     llm_provider: str,
     model_name: str,
     search_provider: str,
     num_results: int,
-) -> tuple[str, str, str, str]:
+    force_refresh: bool = False,
+) -> AsyncIterator[tuple[str, str, str, str]]:
     """
-    Execute research and return formatted results.
+    Execute research and stream formatted results as they are produced.
 
     Args:
         query: Research question
@@ -70,49 +75,59 @@ def research_interface(
         model_name: Selected model
         search_provider: Selected search provider
         num_results: Results per step
+        force_refresh: Bypass cached runs, searches and LLM responses
 
-    Returns:
-        Tuple of (status, plan, brief, references)
+    Yields:
+        Tuples of (status, plan, brief, references); the brief updates
+        token by token while the writer is generating
     """
     if not query.strip():
-        return (
+        yield (
             "❌ Please enter a research query",
             "",
             "",
             "",
         )
+        return
 
     try:
-        # Execute research workflow
-        state = run_research(
+        # Execute research workflow, re-rendering on every state update
+        state = None
+        async for state in stream_research(
             query=query,
             llm_provider=llm_provider.lower(),
             model_name=model_name,
             search_provider=search_provider.lower(),
             num_results=num_results,
-        )
+            force_refresh=force_refresh,
+        ):
+            plan_md, brief_md, references_md = format_output(state)
+            yield f"⏳ Researching: *{query}*", plan_md, brief_md, references_md
+
+        if state is None:
+            raise RuntimeError("Workflow produced no output")
 
         # Format output
         plan_md, brief_md, references_md = format_output(state)
 
         status = f"✅ Research completed successfully for: *{query}*"
 
-        return status, plan_md, brief_md, references_md
+        yield status, plan_md, brief_md, references_md
 
     except ValueError as e:
         # Configuration errors
         error_msg = f"❌ Configuration Error: {str(e)}"
-        return error_msg, "", "", ""
+        yield error_msg, "", "", ""
 
     except Exception as e:
         # Unexpected errors
         error_msg = f"❌ Error: {str(e)}"
-        return error_msg, "", "", ""
+        yield error_msg, "", "", ""
 
 
 def update_model_choices(provider: str) -> gr.Dropdown:
     """Update available models based on selected provider."""
-    models = get_available_models(provider.lower())
+    models = list(get_available_models(provider.lower()))
     return gr.Dropdown(choices=models, value=models[0] if models else None)
 
 
@@ -161,15 +176,15 @@ def create_interface() -> gr.Blocks:
                 # LLM provider selection
                 llm_provider = gr.Dropdown(
                     choices=["Anthropic", "OpenAI", "Ollama", "Custom"],
-                    value="Anthropic",
+                    value=DEFAULT_LLM_PROVIDER,
                     label="LLM Provider",
                     info="Select your language model provider",
                 )
 
                 # Model selection (dynamic based on provider)
                 model_name = gr.Dropdown(
-                    choices=get_available_models("anthropic"),
-                    value="claude-sonnet-4-5-20250929",
+                    choices=list(get_available_models(DEFAULT_LLM_PROVIDER.lower())),
+                    value=DEFAULT_MODEL,
                     label="Model",
                     info="Select specific model",
                 )
@@ -183,12 +198,11 @@ def create_interface() -> gr.Blocks:
 
                 # Search provider selection
                 providers_info = get_available_providers()
-                search_choices = [p["display_name"] for p in providers_info]
-                search_values = [p["name"] for p in providers_info]
+                search_choices = [(p["display_name"], p["name"]) for p in providers_info]
 
                 search_provider = gr.Dropdown(
                     choices=search_choices,
-                    value=search_choices[0],  # DuckDuckGo by default
+                    value=providers_info[0]["name"],  # DuckDuckGo by default
                     label="Search Provider",
                     info="Free options available",
                 )
@@ -203,6 +217,13 @@ def create_interface() -> gr.Blocks:
                     info="Number of search results per research step",
                 )
 
+                # Bypass cached results for repeat queries
+                force_refresh = gr.Checkbox(
+                    value=False,
+                    label="Force Refresh",
+                    info="Ignore cached results and research from scratch",
+                )
+
                 # Submit button
                 submit_btn = gr.Button("🚀 Start Research", variant="primary", size="lg")
 
@@ -228,6 +249,7 @@ def create_interface() -> gr.Blocks:
                 model_name,
                 search_provider,
                 num_results,
+                force_refresh,
             ],
             outputs=[
                 status_output,
@@ -246,9 +268,39 @@ def create_interface() -> gr.Blocks:
             """
         )
 
+        # Warm provider connections once the server (and its event loop) is up
+        interface.load(_warmup, show_progress="hidden")
+
     return interface
 
 
+# The warmup runs on the first page load only
+_warmed_up = False
+
+
+async def _warmup() -> None:
+    """
+    Open provider connections before the first query arrives.
+
+    Builds the default LLM client (cached by get_llm) and sends it a
+    1-token completion, so the first user query reuses an established
+    connection instead of paying for cold TCP/TLS setup. Runs on Gradio's
+    event loop, like research_interface, so the async connection pool it
+    warms is the one queries use. Failures (e.g. missing API keys) are
+    ignored here and surface normally when a query is run.
+    """
+    global _warmed_up
+    if _warmed_up:
+        return
+    _warmed_up = True
+
+    try:
+        llm = get_llm(provider=DEFAULT_LLM_PROVIDER.lower(), model_name=DEFAULT_MODEL)
+        await llm.bind(max_tokens=1).ainvoke("ping")
+    except Exception:
+        pass
+
+
 def main():
     """Launch Gradio interface."""
     interface = create_interface()
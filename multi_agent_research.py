@@ -12,7 +12,7 @@ PURPOSE:
 INSTALL:
     pip install 'langchain>=0.3.27,<0.4' 'langgraph>=0.6.8,<0.7' \
                 'langchain-anthropic>=0.3.21,<0.4' 'langchain-openai>=0.3.0' \
-                python-dotenv google-search-results requests
+                python-dotenv requests orjson diskcache tenacity
 
 .ENV EXAMPLES:
 
@@ -48,23 +48,28 @@ RUN EXAMPLES:
 """
 
 import argparse
-import json
+import asyncio
+import html
 import operator
 import os
+import re
 import sys
-import time
-from typing import Annotated, Any, List, TypedDict
+from functools import lru_cache
+from typing import Annotated, Any, Dict, List, Optional, TypedDict
 
+import orjson
 from dotenv import load_dotenv
 from langchain.schema import AIMessage, HumanMessage
-from langchain_anthropic import ChatAnthropic
-from langchain_openai import ChatOpenAI
-from langchain_core.messages import AnyMessage
+from langchain_core.messages import AIMessageChunk, AnyMessage
 from langchain_core.output_parsers import StrOutputParser
 from langchain_core.prompts import ChatPromptTemplate
-from langgraph.checkpoint.memory import MemorySaver
+from langgraph.checkpoint.base import BaseCheckpointSaver
 from langgraph.graph import END, StateGraph
-from serpapi import GoogleSearch
+
+from providers._cache import cached_search
+from providers._http import get_session
+from providers._retry import retry_request
+from providers.semantic_cache import cached_invoke
 
 
 # ─── Configuration ───────────────────────────────────────────────────────────
@@ -78,6 +83,21 @@ OPENAI_BASE_URL = os.getenv("OPENAI_BASE_URL")  # For custom/self-hosted endpoin
 MODEL_NAME = os.getenv("MODEL_NAME", "claude-sonnet-4-5-20250929")
 SERPAPI_API_KEY = os.getenv("SERPAPI_API_KEY")
 
+SERPAPI_URL = "https://serpapi.com/search.json"
+
+# Upper bound on in-flight SerpAPI requests during the research phase
+MAX_CONCURRENT_SEARCHES = 5
+
+# Sources given to the writer, and their text limits in the prompt
+# (past these lengths titles and snippets are mostly boilerplate)
+MAX_SOURCES = 20
+MAX_TITLE_CHARS = 120
+MAX_SNIPPET_CHARS = 160
+
+# SerpAPI snippets carry <b> highlight tags and ragged whitespace
+TAG_RE = re.compile(r"<[^>]+>")
+WS_RE = re.compile(r"\s+")
+
 # Validate required configuration
 if LLM_PROVIDER == "anthropic" and not ANTHROPIC_API_KEY:
     print("❌ ERROR: ANTHROPIC_API_KEY required for provider 'anthropic'", file=sys.stderr)
@@ -90,57 +110,83 @@ if not SERPAPI_API_KEY:
     sys.exit(1)
 
 
+# Tool schema the planner LLM fills in, so the plan needs no JSON parsing
+PLAN_SCHEMA = {
+    "title": "submit_plan",
+    "description": "Submit the research plan.",
+    "type": "object",
+    "properties": {
+        "steps": {
+            "type": "array",
+            "items": {"type": "string"},
+            "minItems": 2,
+            "maxItems": 5,
+        },
+    },
+    "required": ["steps"],
+}
+
+
 # ─── State Definition ────────────────────────────────────────────────────────
 class ResearchState(TypedDict):
     messages: Annotated[List[AnyMessage], operator.add]
     query: str
     plan: List[str]
-    results: List[dict]
+    results: Dict[str, list]  # parallel lists: title, url, snippet, step_index
     draft: str
     final: str
     references: List[str]
     revised_once: bool
+    needs_revision: bool
 
 
 # ─── SerpAPI Tool ────────────────────────────────────────────────────────────
+@retry_request
+def serpapi_request(params: dict) -> dict:
+    """Fetch one SerpAPI result page (retried on network/HTTP errors)."""
+    response = get_session("serpapi").get(SERPAPI_URL, params=params, timeout=15)
+    response.raise_for_status()
+    return orjson.loads(response.content)
+
+
+@cached_search("serpapi")
 def google_search(query: str, num_results: int = 5) -> List[dict]:
     """Execute Google search via SerpAPI with retry logic."""
-    max_retries = 3
-    for attempt in range(max_retries):
-        try:
-            params = {
-                "q": query,
-                "api_key": SERPAPI_API_KEY,
-                "num": min(num_results, 10),
-                "engine": "google",
-            }
-            search = GoogleSearch(params)
-            raw = search.get_dict()
-            organic = raw.get("organic_results", [])
-
-            normalized = []
-            for item in organic[:num_results]:
-                normalized.append({
-                    "title": item.get("title", "No title"),
-                    "url": item.get("link", ""),
-                    "snippet": item.get("snippet", ""),
-                })
-            return normalized
-        except Exception as e:
-            if attempt == max_retries - 1:
-                print(f"⚠️  Search failed after {max_retries} attempts: {e}", file=sys.stderr)
-                return []
-            time.sleep(2 ** attempt)
-    return []
+    params = {
+        "q": query,
+        "api_key": SERPAPI_API_KEY,
+        "num": min(num_results, 10),
+        "engine": "google",
+    }
+
+    try:
+        raw = serpapi_request(params)
+    except Exception as e:
+        print(f"⚠️  Search failed: {e}", file=sys.stderr)
+        return []
+
+    normalized = []
+    for item in raw.get("organic_results", [])[:num_results]:
+        normalized.append({
+            "title": item.get("title", "No title"),
+            "url": item.get("link", ""),
+            "snippet": WS_RE.sub(" ", TAG_RE.sub("", item.get("snippet") or "")).strip(),
+        })
+    return normalized
 
 
 # ─── LLM Initialization ──────────────────────────────────────────────────────
 def get_llm(model_name: str = None):
-    """Initialize LLM based on provider configuration."""
-    if model_name is None:
-        model_name = MODEL_NAME
+    """Get the LLM for the configured provider (one shared client per model)."""
+    return _create_llm(model_name or MODEL_NAME)
+
 
+@lru_cache(maxsize=8)
+def _create_llm(model_name: str):
+    """Initialize LLM based on provider configuration (imports only its SDK)."""
     if LLM_PROVIDER == "anthropic":
+        from langchain_anthropic import ChatAnthropic
+
         return ChatAnthropic(
             model=model_name,
             temperature=0,
@@ -148,6 +194,8 @@ def get_llm(model_name: str = None):
         )
     else:
         # OpenAI-compatible API (works with Ollama, LM Studio, vLLM, etc.)
+        from langchain_openai import ChatOpenAI
+
         return ChatOpenAI(
             model=model_name,
             temperature=0,
@@ -157,72 +205,116 @@ def get_llm(model_name: str = None):
         )
 
 
+# ─── Prompts ─────────────────────────────────────────────────────────────────
+PLANNER_PROMPT = ChatPromptTemplate.from_messages([
+    ("system", "You are a research planner. Given a query, decompose it into 2-5 focused research steps."),
+    ("human", "Query: {query}\n\nSubmit the research steps.")
+])
+
+WRITER_PROMPT = ChatPromptTemplate.from_messages([
+    ("system", "You are a research writer. Synthesize findings into a ≤200-word brief with inline citations [1], [2], etc. Be factual and concise."),
+    ("human", "Query: {query}\n\nResearch Results:\n{results}\n\nWrite brief with citations:")
+])
+
+REVIEWER_PROMPT = ChatPromptTemplate.from_messages([
+    ("system", "You are a fact-checker. Review if all claims have proper citations [n]. Reply with 'APPROVED' or 'NEEDS_REVISION: <reason>'."),
+    ("human", "Draft:\n{draft}\n\nReview:")
+])
+
+
 # ─── Agent Nodes ─────────────────────────────────────────────────────────────
-def planner_node(state: ResearchState) -> dict:
+async def planner_node(state: ResearchState) -> dict:
     """Generate 2-5 research steps from query."""
     llm = get_llm()
-    prompt = ChatPromptTemplate.from_messages([
-        ("system", "You are a research planner. Given a query, decompose it into 2-5 focused research steps. Return ONLY a JSON array of strings."),
-        ("human", "Query: {query}\n\nReturn research steps as JSON array.")
-    ])
-
-    chain = prompt | llm | StrOutputParser()
-    response = chain.invoke({"query": state["query"]})
+    chain = PLANNER_PROMPT | llm.with_structured_output(PLAN_SCHEMA, method="function_calling")
 
     try:
-        plan = json.loads(response)
-        if not isinstance(plan, list) or len(plan) < 2 or len(plan) > 5:
-            plan = [state["query"]]
-    except json.JSONDecodeError:
+        plan = (await cached_invoke(chain, "planner", {"query": state["query"]}))["steps"]
+    except Exception:
+        # No tool call (some OpenAI-compatible backends) or a malformed plan
+        plan = None
+
+    # A dict schema isn't validated client-side, and providers don't
+    # enforce minItems/maxItems, so check the bounds here
+    if not (
+        isinstance(plan, list)
+        and 2 <= len(plan) <= 5
+        and all(isinstance(step, str) and step.strip() for step in plan)
+    ):
         plan = [state["query"]]
 
     return {
         "plan": plan,
-        "messages": [AIMessage(content=f"Research plan: {json.dumps(plan)}")],
+        "messages": [AIMessage(content=f"Research plan: {orjson.dumps(plan).decode()}")],
     }
 
 
-def researcher_node(state: ResearchState) -> dict:
-    """Execute searches for each plan step."""
-    results = []
+def normalize_step(step: str) -> str:
+    """Search key for a plan step (case and whitespace insensitive)."""
+    return WS_RE.sub(" ", step.strip().lower())
+
+
+async def researcher_node(state: ResearchState) -> dict:
+    """Execute searches for all plan steps concurrently (duplicates once)."""
     num_results = 5
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_SEARCHES)
+
+    async def run_search(step: str) -> List[dict]:
+        async with semaphore:
+            return await asyncio.to_thread(google_search, step, num_results)
 
+    unique = {}
+    for step in state["plan"]:
+        unique.setdefault(normalize_step(step), step)
+
+    searched = dict(zip(unique, await asyncio.gather(*(run_search(step) for step in unique.values()))))
+
+    results = {"title": [], "url": [], "snippet": [], "step_index": []}
     for idx, step in enumerate(state["plan"]):
-        search_results = google_search(step, num_results)
-        for res in search_results:
-            res["step_index"] = idx
-            results.append(res)
-        time.sleep(0.5)
+        for res in searched[normalize_step(step)]:
+            results["title"].append(res["title"])
+            results["url"].append(res["url"])
+            results["snippet"].append(res["snippet"])
+            results["step_index"].append(idx)
 
     return {
         "results": results,
-        "messages": [AIMessage(content=f"Found {len(results)} total results")],
+        "messages": [AIMessage(content=f"Found {len(results['url'])} total results")],
     }
 
 
-def writer_node(state: ResearchState) -> dict:
+async def writer_node(state: ResearchState) -> dict:
     """Synthesize findings into brief with citations."""
     llm = get_llm()
 
+    # One pass over the results: source [i] in the prompt is references[i-1]
+    sources = []
+    seen_urls = set()
+    results = state["results"]
+    for title, url, snippet in zip(results["title"], results["url"], results["snippet"]):
+        if len(sources) >= MAX_SOURCES:
+            break
+        if url and url not in seen_urls:
+            sources.append((title, url, snippet))
+            seen_urls.add(url)
+
+    references = [url for _, url, _ in sources]
     results_text = "\n\n".join([
-        f"[{i+1}] {r['title']}\nURL: {r['url']}\nSnippet: {r['snippet']}"
-        for i, r in enumerate(state["results"][:20])
+        f"[{i+1}] {html.unescape(title or '')[:MAX_TITLE_CHARS]}\n"
+        f"URL: {url}\n"
+        f"Snippet: {html.unescape(snippet or '')[:MAX_SNIPPET_CHARS]}"
+        for i, (title, url, snippet) in enumerate(sources)
     ])
 
-    prompt = ChatPromptTemplate.from_messages([
-        ("system", "You are a research writer. Synthesize findings into a ≤200-word brief with inline citations [1], [2], etc. Be factual and concise."),
-        ("human", "Query: {query}\n\nResearch Results:\n{results}\n\nWrite brief with citations:")
-    ])
-
-    chain = prompt | llm | StrOutputParser()
-    draft = chain.invoke({"query": state["query"], "results": results_text})
-
-    references = []
-    seen_urls = set()
-    for r in state["results"][:20]:
-        if r["url"] and r["url"] not in seen_urls:
-            references.append(r["url"])
-            seen_urls.add(r["url"])
+    chain = WRITER_PROMPT | llm | StrOutputParser()
+    draft = await cached_invoke(
+        chain,
+        "writer",
+        {"query": state["query"], "results": results_text},
+        key=state["query"],
+        scope=results_text,
+        lookup=not state.get("revised_once", False),
+    )
 
     return {
         "draft": draft,
@@ -231,43 +323,49 @@ def writer_node(state: ResearchState) -> dict:
     }
 
 
-def reviewer_node(state: ResearchState) -> dict:
-    """Validate citations and decide if revision needed."""
-    llm = get_llm()
+def citations_valid(draft: str, num_references: int) -> bool:
+    """True if the draft cites at least one source and every [n] is a real reference."""
+    cites = {int(n) for n in re.findall(r"\[(\d+)\]", draft)}
+    return bool(cites) and min(cites) >= 1 and max(cites) <= num_references
 
-    prompt = ChatPromptTemplate.from_messages([
-        ("system", "You are a fact-checker. Review if all claims have proper citations [n]. Reply with 'APPROVED' or 'NEEDS_REVISION: <reason>'."),
-        ("human", "Draft:\n{draft}\n\nReview:")
-    ])
 
-    chain = prompt | llm | StrOutputParser()
-    review = chain.invoke({"draft": state["draft"]})
+async def reviewer_node(state: ResearchState) -> dict:
+    """Validate citations and decide if revision needed."""
+    # Well-formed citations need no LLM review
+    if citations_valid(state["draft"], len(state["references"])):
+        return {
+            "final": state["draft"],
+            "needs_revision": False,
+            "messages": [AIMessage(content="Citations valid, research complete")],
+        }
+
+    llm = get_llm()
+    chain = REVIEWER_PROMPT | llm | StrOutputParser()
+    review = await cached_invoke(chain, "reviewer", {"draft": state["draft"]}, scope=state["draft"])
 
     if "NEEDS_REVISION" in review and not state.get("revised_once", False):
         return {
             "revised_once": True,
+            "needs_revision": True,
             "messages": [AIMessage(content=f"Revision requested: {review}")],
         }
 
     return {
         "final": state["draft"],
+        "needs_revision": False,
         "messages": [AIMessage(content="Research complete")],
     }
 
 
 # ─── Routing Logic ───────────────────────────────────────────────────────────
 def should_revise(state: ResearchState) -> str:
-    """Route to writer for revision or end."""
-    if state.get("final"):
-        return END
-    if state.get("revised_once", False):
-        return "writer"
-    return "writer" if not state.get("draft") else END
+    """Route back to the writer if the reviewer asked for a revision."""
+    return "writer" if state.get("needs_revision") else END
 
 
 # ─── Graph Construction ──────────────────────────────────────────────────────
-def build_graph() -> StateGraph:
-    """Construct LangGraph workflow."""
+def build_graph(checkpointer: Optional[BaseCheckpointSaver] = None) -> StateGraph:
+    """Construct LangGraph workflow (checkpointed only if a saver is given)."""
     workflow = StateGraph(ResearchState)
 
     workflow.add_node("planner", planner_node)
@@ -281,14 +379,24 @@ def build_graph() -> StateGraph:
     workflow.add_edge("writer", "reviewer")
     workflow.add_conditional_edges(
         "reviewer",
-        lambda s: "writer" if (not s.get("final") and not s.get("revised_once", False)) else END,
+        should_revise,
         {"writer": "writer", END: END}
     )
 
-    return workflow.compile(checkpointer=MemorySaver())
+    return workflow.compile(checkpointer=checkpointer)
 
 
 # ─── CLI & Execution ─────────────────────────────────────────────────────────
+def chunk_text(message: AIMessageChunk) -> str:
+    """Text of a streamed token chunk (plain string or content blocks)."""
+    if isinstance(message.content, str):
+        return message.content
+    return "".join(
+        block.get("text", "") for block in message.content
+        if isinstance(block, dict) and block.get("type") == "text"
+    )
+
+
 def main():
     parser = argparse.ArgumentParser(description="Multi-agent research with Claude + SerpAPI")
     parser.add_argument("--query", required=True, help="Research query")
@@ -312,21 +420,45 @@ def main():
         "messages": [HumanMessage(content=args.query)],
         "query": args.query,
         "plan": [],
-        "results": [],
+        "results": {"title": [], "url": [], "snippet": [], "step_index": []},
         "draft": "",
         "final": "",
         "references": [],
         "revised_once": False,
+        "needs_revision": False,
     }
 
-    config = {"configurable": {"thread_id": "research_001"}}
+    async def run_graph() -> dict:
+        """Run the graph, printing the writer's tokens as they stream in."""
+        final_state = dict(initial_state)
+        drafting = False
+        async for mode, chunk in graph.astream(
+            initial_state, stream_mode=["updates", "messages"]
+        ):
+            if mode == "messages":
+                message, metadata = chunk
+                if metadata.get("langgraph_node") == "writer" and isinstance(message, AIMessageChunk):
+                    if not drafting:
+                        print("✍️  DRAFTING:")
+                        drafting = True
+                    print(chunk_text(message), end="", flush=True)
+                continue
+
+            if drafting:
+                print("\n")
+                drafting = False
+            for update in chunk.values():
+                for key, value in (update or {}).items():
+                    if key == "messages":
+                        final_state[key] = final_state[key] + value
+                    else:
+                        final_state[key] = value
+        return final_state
 
     try:
-        final_state = None
-        for state in graph.stream(initial_state, config):
-            final_state = list(state.values())[0]
+        final_state = asyncio.run(run_graph())
 
-        if not final_state:
+        if not final_state.get("draft"):
             print("❌ ERROR: Workflow produced no output", file=sys.stderr)
             sys.exit(1)
 
@@ -336,13 +468,14 @@ def main():
         print()
 
         print("🔗 TOP RESULTS:")
-        for i, res in enumerate(final_state.get("results", [])[:10], 1):
-            print(f"  [{i}] {res['title']}")
-            print(f"      {res['url']}")
+        results = final_state["results"]
+        for i, (title, url) in enumerate(zip(results["title"][:10], results["url"]), 1):
+            print(f"  [{i}] {title}")
+            print(f"      {url}")
         print()
 
         print("📝 FINAL BRIEF:")
-        print(final_state.get("final", final_state.get("draft", "No output generated")))
+        print(final_state.get("final") or final_state.get("draft") or "No output generated")
         print()
 
         print("📚 REFERENCES:")
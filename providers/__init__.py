@@ -1,9 +1,15 @@
 """Provider abstraction layers for LLM and search services."""
 
-from .llm import get_llm
-from .search import search
+from .llm import cacheable_system_message, get_llm
+from .search import BATCH_PROVIDERS, search, search_batch
+from .semantic_cache import cache_scope, cached_invoke
 
 __all__ = [
+    "BATCH_PROVIDERS",
+    "cache_scope",
+    "cached_invoke",
+    "cacheable_system_message",
     "get_llm",
     "search",
+    "search_batch",
 ]
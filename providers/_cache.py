@@ -0,0 +1,77 @@
+"""Persistent exact-match cache for search provider results."""
+
+import functools
+import hashlib
+import os
+from functools import lru_cache
+from typing import Callable, Optional
+
+import diskcache
+
+# Search results go stale quickly, so keep them for an hour
+SEARCH_CACHE_TTL = 60 * 60
+
+SearchFn = Callable[[str, int], list[dict]]
+
+
+@lru_cache(maxsize=1)
+def _search_cache() -> diskcache.Cache:
+    """Open the on-disk search result cache (RESEARCH_CACHE_DIR/search)."""
+    cache_dir = os.getenv("RESEARCH_CACHE_DIR", "~/.cache/multi_agent_research")
+    return diskcache.Cache(os.path.join(os.path.expanduser(cache_dir), "search"))
+
+
+def _search_cache_key(provider: str, query: str, num_results: int) -> str:
+    """Stable key for one provider request."""
+    raw = f"{provider}|{query}|{num_results}"
+    return hashlib.blake2b(raw.encode(), digest_size=16).hexdigest()
+
+
+def get_cached_results(provider: str, query: str, num_results: int) -> Optional[list[dict]]:
+    """Return cached results for one provider request, or None on a miss."""
+    return _search_cache().get(_search_cache_key(provider, query, num_results))
+
+
+def cache_results(provider: str, query: str, num_results: int, results: list[dict]) -> None:
+    """Store results for one provider request (empty results are skipped)."""
+    if results:
+        _search_cache().set(
+            _search_cache_key(provider, query, num_results), results, expire=SEARCH_CACHE_TTL
+        )
+
+
+def cached_search(provider: str) -> Callable[[SearchFn], SearchFn]:
+    """
+    Memoize a search function's results on disk for SEARCH_CACHE_TTL seconds.
+
+    Hits skip the wrapped function entirely (network request, rate limit
+    wait and parsing). Passing refresh=True skips the lookup (the fresh
+    results are still stored). Empty results are not stored, since
+    providers return [] on failure.
+
+    Args:
+        provider: Provider name, part of the cache key
+
+    Returns:
+        Decorator for functions taking (query, num_results); the wrapper
+        also accepts refresh
+
+    Example:
+        >>> @cached_search("brave")
+        ... def _search_brave(query, num_results): ...
+    """
+    def decorator(fn: SearchFn) -> SearchFn:
+        @functools.wraps(fn)
+        def wrapper(query: str, num_results: int = 5, refresh: bool = False) -> list[dict]:
+            if not refresh:
+                results = get_cached_results(provider, query, num_results)
+                if results is not None:
+                    return results
+
+            results = fn(query, num_results)
+            cache_results(provider, query, num_results, results)
+            return results
+
+        return wrapper
+
+    return decorator
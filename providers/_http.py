@@ -0,0 +1,76 @@
+"""Shared HTTP connection pools for LLM and search provider clients."""
+
+import atexit
+from functools import lru_cache
+
+import httpx
+import requests
+from requests.adapters import HTTPAdapter
+
+# Keep-alive pool sized for one research run's concurrent LLM calls
+HTTP_LIMITS = httpx.Limits(max_keepalive_connections=20, max_connections=100)
+HTTP_TIMEOUT = httpx.Timeout(60.0, connect=10.0)
+
+# Keep-alive connections per search host; covers a full concurrent fan-out
+SEARCH_POOL_SIZE = 10
+
+
+@lru_cache(maxsize=None)
+def get_http_client() -> httpx.Client:
+    """
+    Get the process-wide HTTP client, creating it on first use.
+
+    Reusing one client keeps TCP/TLS connections alive between agent calls,
+    and HTTP/2 lets concurrent requests to the same host share a connection.
+
+    Returns:
+        Shared httpx.Client (closed automatically at interpreter exit)
+    """
+    client = httpx.Client(http2=True, limits=HTTP_LIMITS, timeout=HTTP_TIMEOUT)
+    atexit.register(client.close)
+    return client
+
+
+@lru_cache(maxsize=None)
+def get_async_http_client() -> httpx.AsyncClient:
+    """
+    Get the process-wide async HTTP client, creating it on first use.
+
+    The agents call their LLMs with ainvoke, which goes through this client
+    rather than get_http_client(). Its pooled connections belong to the
+    event loop that opened them, so callers should keep to one long-lived
+    loop (workflow's synchronous entry points share one; the web app runs
+    on Gradio's).
+
+    Returns:
+        Shared httpx.AsyncClient
+    """
+    return httpx.AsyncClient(http2=True, limits=HTTP_LIMITS, timeout=HTTP_TIMEOUT)
+
+
+@lru_cache(maxsize=None)
+def get_session(provider: str = "default") -> requests.Session:
+    """
+    Get the requests session for a search provider, creating it on first use.
+
+    Each provider gets its own session and connection pool, sized so a
+    concurrent fan-out reuses kept-alive connections instead of opening
+    new ones (and skipping the TCP/TLS handshake on repeat calls).
+    Retries are handled by the callers, so the adapter never retries.
+
+    Args:
+        provider: Search provider name (one session per name)
+
+    Returns:
+        Shared requests.Session (closed automatically at interpreter exit)
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=SEARCH_POOL_SIZE,
+        pool_maxsize=SEARCH_POOL_SIZE,
+        max_retries=0,
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    atexit.register(session.close)
+    return session
@@ -0,0 +1,64 @@
+"""Per-provider token-bucket rate limiting for search requests."""
+
+import threading
+import time
+
+# Sustained requests/second and burst size per search provider
+PROVIDER_RATE_LIMITS = {
+    "duckduckgo": {"rate": 1.0, "burst": 2},  # Unofficial endpoint, throttles aggressively
+    "brave": {"rate": 1.0, "burst": 1},  # Free plan: 1 query/second
+    "serper": {"rate": 5.0, "burst": 5},
+}
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket limiter.
+
+    Tokens refill continuously at `rate` per second up to `burst`. Each
+    acquire() takes one token, sleeping only when the bucket is empty, so
+    requests within the burst budget go out immediately.
+
+    Args:
+        rate: Tokens added per second
+        burst: Maximum tokens held (requests allowed back-to-back)
+
+    Example:
+        >>> bucket = TokenBucket(rate=1.0, burst=2)
+        >>> bucket.acquire()  # returns immediately while tokens remain
+    """
+
+    def __init__(self, rate: float, burst: int):
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._last_refill = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """Take one token, blocking until it is available."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._last_refill) * self.rate)
+            self._last_refill = now
+
+            # Reserve the token now (possibly going into debt) so concurrent
+            # callers queue up behind each other instead of all waking at once
+            self._tokens -= 1
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+
+        if wait > 0:
+            time.sleep(wait)
+
+
+_buckets = {
+    provider: TokenBucket(limits["rate"], limits["burst"])
+    for provider, limits in PROVIDER_RATE_LIMITS.items()
+}
+
+
+def acquire(provider: str) -> None:
+    """Wait for the provider's rate limit (no-op for unknown providers)."""
+    bucket = _buckets.get(provider)
+    if bucket is not None:
+        bucket.acquire()
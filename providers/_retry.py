@@ -0,0 +1,80 @@
+"""Retry policy for search provider HTTP requests."""
+
+import email.utils
+import time
+from datetime import timezone
+from typing import Callable, Optional, TypeVar
+
+import requests
+from tenacity import (
+    RetryCallState,
+    retry,
+    retry_if_exception_type,
+    stop_after_attempt,
+    wait_exponential_jitter,
+)
+
+MAX_ATTEMPTS = 3
+
+# Never sleep longer than this, whatever Retry-After says
+MAX_RETRY_AFTER = 60.0
+
+T = TypeVar("T")
+
+_backoff = wait_exponential_jitter(initial=1, max=8)
+
+
+def _retry_after(exc: Optional[BaseException]) -> Optional[float]:
+    """Seconds requested by a 429/503 Retry-After header, if any."""
+    response = getattr(exc, "response", None)
+    header = response.headers.get("Retry-After") if response is not None else None
+    if not header:
+        return None
+
+    try:
+        seconds = float(header)
+    except ValueError:
+        # HTTP-date form; anything unparseable falls back to backoff
+        try:
+            parsed = email.utils.parsedate_to_datetime(header)
+        except (TypeError, ValueError):
+            return None
+        if parsed.tzinfo is None:
+            parsed = parsed.replace(tzinfo=timezone.utc)
+        seconds = parsed.timestamp() - time.time()
+
+    return min(max(seconds, 0.0), MAX_RETRY_AFTER)
+
+
+def _wait(retry_state: RetryCallState) -> float:
+    """Honor the server's Retry-After, else exponential backoff with jitter."""
+    exc = retry_state.outcome.exception() if retry_state.outcome else None
+    retry_after = _retry_after(exc)
+    if retry_after is not None:
+        return retry_after
+
+    return _backoff(retry_state)
+
+
+def retry_request(fn: Callable[..., T]) -> Callable[..., T]:
+    """
+    Retry a request function on network and HTTP errors.
+
+    Makes up to MAX_ATTEMPTS attempts. Between attempts it waits for the
+    server's Retry-After (capped at MAX_RETRY_AFTER), or otherwise backs off
+    exponentially with jitter so concurrent searches that fail together
+    don't retry in lockstep. The last exception is re-raised.
+
+    Example:
+        >>> @retry_request
+        ... def _fetch(url):
+        ...     response = requests.get(url, timeout=10)
+        ...     response.raise_for_status()
+        ...     return response
+    """
+    return retry(
+        stop=stop_after_attempt(MAX_ATTEMPTS),
+        wait=_wait,
+        retry=retry_if_exception_type(requests.exceptions.RequestException),
+        reraise=True,
+    )(fn)
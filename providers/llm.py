@@ -1,10 +1,12 @@
 """LLM provider abstraction layer supporting multiple backends."""
 
 import os
+from functools import lru_cache
 from typing import Optional
 
-from langchain_anthropic import ChatAnthropic
-from langchain_openai import ChatOpenAI
+from langchain_core.messages import SystemMessage
+
+from ._http import get_async_http_client, get_http_client
 
 
 def get_llm(
@@ -15,6 +17,13 @@ def get_llm(
     """
     Factory function to create LLM instance based on provider.
 
+    Instances are cached per (provider, model_name, temperature), so all
+    agents in a run share one client and its warm HTTP connection instead
+    of re-creating it on every node invocation. OpenAI-compatible clients
+    additionally share one HTTP/2 connection pool per sync/async client
+    (the agents use the async one); ChatAnthropic
+    already pools connections through langchain-anthropic's cached client.
+
     Args:
         provider: LLM provider ('anthropic', 'openai', 'ollama', 'custom')
                  Defaults to LLM_PROVIDER env var or 'anthropic'
@@ -37,7 +46,20 @@ def get_llm(
     if model_name is None:
         model_name = os.getenv("MODEL_NAME", "claude-sonnet-4-5-20250929")
 
+    return _create_llm(provider, model_name, temperature)
+
+
+@lru_cache(maxsize=16)
+def _create_llm(provider: str, model_name: str, temperature: float):
+    """
+    Build the LLM client for a resolved provider/model (cached by get_llm).
+
+    The LangChain integrations are imported in the branch that uses them,
+    so only the configured provider's SDK is loaded, on first use.
+    """
     if provider == "anthropic":
+        from langchain_anthropic import ChatAnthropic
+
         api_key = os.getenv("ANTHROPIC_API_KEY")
         if not api_key:
             raise ValueError(
@@ -53,6 +75,8 @@ def get_llm(
         )
 
     elif provider == "openai":
+        from langchain_openai import ChatOpenAI
+
         api_key = os.getenv("OPENAI_API_KEY")
         if not api_key:
             raise ValueError(
@@ -64,10 +88,14 @@ def get_llm(
             model=model_name,
             temperature=temperature,
             openai_api_key=api_key,
+            http_client=get_http_client(),
+            http_async_client=get_async_http_client(),
             max_retries=3,
         )
 
     elif provider == "ollama":
+        from langchain_openai import ChatOpenAI
+
         base_url = os.getenv("OLLAMA_BASE_URL", "http://localhost:11434/v1")
 
         return ChatOpenAI(
@@ -75,10 +103,14 @@ def get_llm(
             temperature=temperature,
             openai_api_key="not-needed",  # Ollama doesn't require API key
             openai_api_base=base_url,
+            http_client=get_http_client(),
+            http_async_client=get_async_http_client(),
             max_retries=3,
         )
 
     elif provider == "custom":
+        from langchain_openai import ChatOpenAI
+
         base_url = os.getenv("OPENAI_BASE_URL")
         if not base_url:
             raise ValueError(
@@ -93,6 +125,8 @@ def get_llm(
             temperature=temperature,
             openai_api_key=api_key,
             openai_api_base=base_url,
+            http_client=get_http_client(),
+            http_async_client=get_async_http_client(),
             max_retries=3,
         )
 
@@ -103,15 +137,43 @@ def get_llm(
         )
 
 
-def get_available_models(provider: str) -> list[str]:
+def cacheable_system_message(text: str, provider: Optional[str] = None) -> SystemMessage:
+    """
+    Build a system message whose static prefix the provider can cache.
+
+    Anthropic only reuses a prompt prefix that is explicitly marked with
+    cache_control, so the text is sent as a content block tagged ephemeral.
+    OpenAI-compatible backends cache prefixes automatically (or not at all)
+    and get a plain string.
+
+    Args:
+        text: Static system instructions (must not vary per request)
+        provider: LLM provider. Defaults to LLM_PROVIDER env var or 'anthropic'
+
+    Returns:
+        SystemMessage to place ahead of the per-request human turn
+    """
+    if provider is None:
+        provider = os.getenv("LLM_PROVIDER", "anthropic")
+
+    if provider == "anthropic":
+        return SystemMessage(content=[
+            {"type": "text", "text": text, "cache_control": {"type": "ephemeral"}},
+        ])
+
+    return SystemMessage(content=text)
+
+
+@lru_cache(maxsize=None)
+def get_available_models(provider: str) -> tuple[str, ...]:
     """
-    Get list of available models for a provider.
+    Get available models for a provider (cached; the list is static).
 
     Args:
         provider: LLM provider name
 
     Returns:
-        List of model identifiers
+        Tuple of model identifiers
     """
     models = {
         "anthropic": [
@@ -140,4 +202,4 @@ def get_available_models(provider: str) -> list[str]:
         ],
     }
 
-    return models.get(provider, [])
+    return tuple(models.get(provider, []))
@@ -1,25 +1,49 @@
 """Search provider abstraction layer supporting multiple backends."""
 
 import os
-import time
+import re
+from functools import lru_cache
 from typing import Optional
 
+import orjson
 import requests
 
+from ._cache import cache_results, cached_search, get_cached_results
+from ._http import get_session
+from ._ratelimit import acquire
+from ._retry import MAX_ATTEMPTS, retry_request
+
+# Providers whose API answers several queries in one request (search_batch)
+BATCH_PROVIDERS = frozenset({"serper"})
+
+SERPER_URL = "https://google.serper.dev/search"
+
+# Snippets carry highlight markup (<b>...</b>) and ragged whitespace that
+# only cost writer prompt tokens
+_TAG_RE = re.compile(r"<[^>]+>")
+_WS_RE = re.compile(r"\s+")
+
 
 def search(
     query: str,
     provider: Optional[str] = None,
     num_results: int = 5,
+    refresh: bool = False,
 ) -> list[dict]:
     """
     Execute search across multiple providers with unified interface.
 
+    Requests are throttled per provider (see PROVIDER_RATE_LIMITS), so
+    concurrent callers stay within each provider's rate limit. Results are
+    cached on disk for an hour (see SEARCH_CACHE_TTL); cache hits make no
+    request and don't count against the rate limit.
+
     Args:
         query: Search query string
         provider: Search provider ('duckduckgo', 'brave', 'serper')
                  Defaults to SEARCH_PROVIDER env var or 'duckduckgo'
         num_results: Number of results to return (1-10)
+        refresh: Skip the cache lookup and search again
 
     Returns:
         List of search results: [{"title": str, "url": str, "snippet": str}, ...]
@@ -34,11 +58,11 @@ def search(
     num_results = max(1, min(num_results, 10))
 
     if provider == "duckduckgo":
-        return _search_duckduckgo(query, num_results)
+        return _search_duckduckgo(query, num_results, refresh=refresh)
     elif provider == "brave":
-        return _search_brave(query, num_results)
+        return _search_brave(query, num_results, refresh=refresh)
     elif provider == "serper":
-        return _search_serper(query, num_results)
+        return _search_serper(query, num_results, refresh=refresh)
     else:
         raise ValueError(
             f"Unknown search provider: {provider}. "
@@ -46,6 +70,69 @@ def search(
         )
 
 
+def search_batch(
+    queries: list[str],
+    provider: Optional[str] = None,
+    num_results: int = 5,
+    refresh: bool = False,
+) -> list[list[dict]]:
+    """
+    Execute several searches with a single provider request.
+
+    Queries already in the search cache are served from it; the rest go
+    out together in one request, costing one round trip instead of one
+    per query. Only providers in BATCH_PROVIDERS support this.
+
+    Args:
+        queries: Search query strings
+        provider: Search provider (must be in BATCH_PROVIDERS)
+                 Defaults to SEARCH_PROVIDER env var or 'duckduckgo'
+        num_results: Number of results per query (1-10)
+        refresh: Skip the cache lookup and search every query again
+
+    Returns:
+        One result list per query, in input order (see search)
+
+    Raises:
+        ValueError: If the provider has no batch API or is misconfigured
+
+    Examples:
+        >>> results = search_batch(["AI adoption", "Job displacement"], "serper", 5)
+    """
+    if provider is None:
+        provider = os.getenv("SEARCH_PROVIDER", "duckduckgo")
+
+    if provider not in BATCH_PROVIDERS:
+        raise ValueError(
+            f"Batch search not supported by provider: {provider}. "
+            f"Supported: {', '.join(sorted(BATCH_PROVIDERS))}"
+        )
+
+    num_results = max(1, min(num_results, 10))
+
+    results = [
+        None if refresh else get_cached_results(provider, query, num_results)
+        for query in queries
+    ]
+    missing = [i for i, cached in enumerate(results) if cached is None]
+    if missing:
+        fetched = _search_serper_batch([queries[i] for i in missing], num_results)
+        for i, step_results in zip(missing, fetched):
+            results[i] = step_results
+            cache_results(provider, queries[i], num_results, step_results)
+
+    return results
+
+
+@retry_request
+def _request(provider: str, method: str, url: str, **kwargs) -> requests.Response:
+    """Send a request on the provider's session, raising on HTTP error status."""
+    response = get_session(provider).request(method, url, **kwargs)
+    response.raise_for_status()
+    return response
+
+
+@cached_search("duckduckgo")
 def _search_duckduckgo(query: str, num_results: int) -> list[dict]:
     """
     Search using DuckDuckGo (free, no API key required).
@@ -55,6 +142,8 @@ def _search_duckduckgo(query: str, num_results: int) -> list[dict]:
     try:
         from duckduckgo_search import DDGS
 
+        acquire("duckduckgo")
+
         results = []
         with DDGS() as ddgs:
             search_results = ddgs.text(query, max_results=num_results)
@@ -62,7 +151,7 @@ def _search_duckduckgo(query: str, num_results: int) -> list[dict]:
                 results.append({
                     "title": item.get("title", "No title"),
                     "url": item.get("href", ""),
-                    "snippet": item.get("body", ""),
+                    "snippet": _clean_snippet(item.get("body")),
                 })
 
         return results
@@ -77,6 +166,7 @@ def _search_duckduckgo(query: str, num_results: int) -> list[dict]:
         return []
 
 
+@cached_search("brave")
 def _search_brave(query: str, num_results: int) -> list[dict]:
     """
     Search using Brave Search API (2,000 free queries/month).
@@ -91,43 +181,39 @@ def _search_brave(query: str, num_results: int) -> list[dict]:
             "Get your API key at https://brave.com/search/api/"
         )
 
-    max_retries = 3
-    for attempt in range(max_retries):
-        try:
-            url = "https://api.search.brave.com/res/v1/web/search"
-            headers = {
-                "Accept": "application/json",
-                "Accept-Encoding": "gzip",
-                "X-Subscription-Token": api_key,
-            }
-            params = {
-                "q": query,
-                "count": num_results,
-            }
-
-            response = requests.get(url, headers=headers, params=params, timeout=10)
-            response.raise_for_status()
-            data = response.json()
-
-            results = []
-            for item in data.get("web", {}).get("results", [])[:num_results]:
-                results.append({
-                    "title": item.get("title", "No title"),
-                    "url": item.get("url", ""),
-                    "snippet": item.get("description", ""),
-                })
+    acquire("brave")
+
+    url = "https://api.search.brave.com/res/v1/web/search"
+    headers = {
+        "Accept": "application/json",
+        "Accept-Encoding": "gzip",
+        "X-Subscription-Token": api_key,
+    }
+    params = {
+        "q": query,
+        "count": num_results,
+    }
 
-            return results
+    try:
+        response = _request("brave", "GET", url, headers=headers, params=params, timeout=10)
+    except requests.exceptions.RequestException as e:
+        print(f"⚠️  Brave search failed after {MAX_ATTEMPTS} attempts: {e}")
+        return []
 
-        except requests.exceptions.RequestException as e:
-            if attempt == max_retries - 1:
-                print(f"⚠️  Brave search failed after {max_retries} attempts: {e}")
-                return []
-            time.sleep(2 ** attempt)
+    data = orjson.loads(response.content)
 
-    return []
+    results = []
+    for item in data.get("web", {}).get("results", [])[:num_results]:
+        results.append({
+            "title": item.get("title", "No title"),
+            "url": item.get("url", ""),
+            "snippet": _clean_snippet(item.get("description")),
+        })
 
+    return results
 
+
+@cached_search("serper")
 def _search_serper(query: str, num_results: int) -> list[dict]:
     """
     Search using Serper.dev API (2,500 free queries/month).
@@ -135,57 +221,101 @@ def _search_serper(query: str, num_results: int) -> list[dict]:
     Requires SERPER_API_KEY environment variable.
     Get API key at: https://serper.dev
     """
+    api_key = _serper_api_key()
+
+    acquire("serper")
+
+    payload = {
+        "q": query,
+        "num": num_results,
+    }
+
+    try:
+        response = _request(
+            "serper", "POST", SERPER_URL, json=payload, headers=_serper_headers(api_key), timeout=10
+        )
+    except requests.exceptions.RequestException as e:
+        print(f"⚠️  Serper search failed after {MAX_ATTEMPTS} attempts: {e}")
+        return []
+
+    return _parse_serper(orjson.loads(response.content), num_results)
+
+
+def _search_serper_batch(queries: list[str], num_results: int) -> list[list[dict]]:
+    """
+    Search several queries with one Serper request.
+
+    Serper accepts a JSON array of queries and answers with an array of
+    results in the same order.
+    """
+    api_key = _serper_api_key()
+
+    acquire("serper")
+
+    payload = [{"q": query, "num": num_results} for query in queries]
+
+    try:
+        response = _request(
+            "serper", "POST", SERPER_URL, json=payload, headers=_serper_headers(api_key), timeout=20
+        )
+    except requests.exceptions.RequestException as e:
+        print(f"⚠️  Serper batch search failed after {MAX_ATTEMPTS} attempts: {e}")
+        return [[] for _ in queries]
+
+    data = orjson.loads(response.content)
+    if not isinstance(data, list):
+        data = [data]
+
+    batch = [_parse_serper(item, num_results) for item in data[:len(queries)]]
+    return batch + [[] for _ in range(len(queries) - len(batch))]
+
+
+def _clean_snippet(text: Optional[str]) -> str:
+    """Strip HTML tags from a snippet and collapse its whitespace."""
+    return _WS_RE.sub(" ", _TAG_RE.sub("", text or "")).strip()
+
+
+def _serper_api_key() -> str:
+    """Read SERPER_API_KEY, raising a helpful error if it is missing."""
     api_key = os.getenv("SERPER_API_KEY")
     if not api_key:
         raise ValueError(
             "SERPER_API_KEY required for Serper. "
             "Get your API key at https://serper.dev"
         )
+    return api_key
 
-    max_retries = 3
-    for attempt in range(max_retries):
-        try:
-            url = "https://google.serper.dev/search"
-            headers = {
-                "X-API-KEY": api_key,
-                "Content-Type": "application/json",
-            }
-            payload = {
-                "q": query,
-                "num": num_results,
-            }
-
-            response = requests.post(url, json=payload, headers=headers, timeout=10)
-            response.raise_for_status()
-            data = response.json()
-
-            results = []
-            for item in data.get("organic", [])[:num_results]:
-                results.append({
-                    "title": item.get("title", "No title"),
-                    "url": item.get("link", ""),
-                    "snippet": item.get("snippet", ""),
-                })
 
-            return results
+def _serper_headers(api_key: str) -> dict:
+    """Request headers for the Serper API."""
+    return {
+        "X-API-KEY": api_key,
+        "Content-Type": "application/json",
+    }
 
-        except requests.exceptions.RequestException as e:
-            if attempt == max_retries - 1:
-                print(f"⚠️  Serper search failed after {max_retries} attempts: {e}")
-                return []
-            time.sleep(2 ** attempt)
 
-    return []
+def _parse_serper(data: dict, num_results: int) -> list[dict]:
+    """Normalize one Serper response to the common result shape."""
+    results = []
+    for item in data.get("organic", [])[:num_results]:
+        results.append({
+            "title": item.get("title", "No title"),
+            "url": item.get("link", ""),
+            "snippet": _clean_snippet(item.get("snippet")),
+        })
 
+    return results
 
-def get_available_providers() -> list[dict]:
+
+@lru_cache(maxsize=None)
+def get_available_providers() -> tuple[dict, ...]:
     """
-    Get list of available search providers with metadata.
+    Get available search providers with metadata (cached; the list is static).
 
     Returns:
-        List of provider info dicts with name, cost, and requirements
+        Tuple of provider info dicts with name, cost, and requirements
     """
-    return [
+    return (
         {
             "name": "duckduckgo",
             "display_name": "DuckDuckGo (Free)",
@@ -210,4 +340,4 @@ def get_available_providers() -> list[dict]:
             "requires_api_key": True,
             "description": "Google-powered results, 2.5K free queries/month",
         },
-    ]
+    )
@@ -0,0 +1,224 @@
+"""Semantic response cache for LLM calls, namespaced per agent role."""
+
+import asyncio
+import os
+import threading
+import time
+import uuid
+from functools import lru_cache
+from typing import Any, Callable, Optional
+
+import diskcache
+
+# Small local model so embedding a query stays cheap and offline
+EMBEDDING_MODEL = "all-MiniLM-L6-v2"
+
+# Minimum cosine similarity for a paraphrase to count as a hit
+DEFAULT_THRESHOLD = 0.87
+
+
+@lru_cache(maxsize=1)
+def _load_embedder():
+    """Load the embedding model once, or return None if it is unavailable."""
+    try:
+        from sentence_transformers import SentenceTransformer
+    except ImportError:
+        return None
+
+    try:
+        return SentenceTransformer(EMBEDDING_MODEL)
+    except Exception as e:
+        # e.g. offline with no local copy of the model; caching is optional
+        print(f"⚠️  Semantic cache disabled, embedding model failed to load: {e}")
+        return None
+
+
+def embed(text: str):
+    """
+    Embed text as a unit-norm vector for similarity lookups.
+
+    Args:
+        text: Text to embed
+
+    Returns:
+        numpy array, or None when sentence-transformers is not installed
+        or the model can't be loaded or run (a cache miss, never an error)
+    """
+    model = _load_embedder()
+    if model is None:
+        return None
+
+    try:
+        return model.encode(text, normalize_embeddings=True)
+    except Exception as e:
+        print(f"⚠️  Semantic cache lookup skipped, embedding failed: {e}")
+        return None
+
+
+class SemanticCache:
+    """
+    Cache that returns stored responses for similar embeddings.
+
+    Entries are only compared within the same scope, so callers can require
+    exact agreement on part of the key (e.g. the set of source URLs) while
+    matching the rest semantically. Lookups scan an in-memory copy; with a
+    store, entries are also written to disk and loaded on creation, so they
+    outlive the process (e.g. across one-shot CLI runs).
+
+    Args:
+        embed_fn: Function mapping text to a unit-norm vector (or None)
+        threshold: Minimum cosine similarity for a cache hit
+        ttl: Entry lifetime in seconds
+        max_entries: Oldest entries are evicted beyond this size
+        store: Optional on-disk cache the entries are persisted in
+
+    Example:
+        >>> cache = SemanticCache(threshold=0.87)
+        >>> emb = cache.embed("impact of AI on jobs")
+        >>> cache.put(emb, ["AI adoption", "Job displacement"])
+        >>> cache.lookup(cache.embed("How does AI affect employment?"))
+        ['AI adoption', 'Job displacement']
+    """
+
+    def __init__(
+        self,
+        embed_fn: Callable[[str], Any] = embed,
+        threshold: float = DEFAULT_THRESHOLD,
+        ttl: float = 3600,
+        max_entries: int = 1000,
+        store: Optional[diskcache.Cache] = None,
+    ):
+        self.embed = embed_fn
+        self.threshold = threshold
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._store = store
+        self._entries: list[tuple[float, str, Any, Any]] = []
+        self._lock = threading.Lock()
+
+        if store is not None:
+            # Expired keys read back as None
+            entries = (store.get(key) for key in list(store))
+            self._entries = sorted(
+                (entry for entry in entries if entry is not None), key=lambda entry: entry[0]
+            )
+            self._evict(time.time())
+
+    def lookup(self, embedding, scope: str = "") -> Optional[Any]:
+        """Return the cached response most similar to embedding, if above threshold."""
+        if embedding is None:
+            return None
+
+        with self._lock:
+            self._evict(time.time())
+            candidates = [e for e in self._entries if e[1] == scope]
+
+        if not candidates:
+            return None
+
+        best_score, best_response = max(
+            ((float(emb @ embedding), response) for _, _, emb, response in candidates),
+            key=lambda item: item[0],
+        )
+        return best_response if best_score >= self.threshold else None
+
+    def put(self, embedding, response: Any, scope: str = "") -> None:
+        """Store a response under embedding (no-op when embeddings are unavailable)."""
+        if embedding is None:
+            return
+
+        entry = (time.time(), scope, embedding, response)
+        with self._lock:
+            self._entries.append(entry)
+            self._evict(time.time())
+
+        if self._store is not None:
+            try:
+                self._store.set(uuid.uuid4().hex, entry, expire=self.ttl)
+            except Exception as e:
+                # Unpicklable response or disk trouble; the memory copy still serves
+                print(f"⚠️  Semantic cache entry not persisted: {e}")
+
+    def _evict(self, now: float) -> None:
+        """Drop expired entries and trim to max_entries (caller holds the lock)."""
+        self._entries = [e for e in self._entries if now - e[0] < self.ttl]
+        if len(self._entries) > self.max_entries:
+            self._entries = self._entries[-self.max_entries:]
+
+
+def cache_scope(llm_provider: Optional[str], model_name: Optional[str], *parts: str) -> str:
+    """
+    Build a cache scope that pins hits to one LLM (plus any exact-match parts).
+
+    Responses from one provider/model must not be served for another, so
+    every agent scopes its cache entries by the LLM that produced them.
+
+    Args:
+        llm_provider: LLM provider the response came from (None = default)
+        model_name: Model identifier (None = default)
+        *parts: Further text that must match exactly (e.g. source URLs)
+
+    Returns:
+        Scope string for cached_invoke
+    """
+    return "\n".join([llm_provider or "", model_name or "", *parts])
+
+
+@lru_cache(maxsize=None)
+def get_cache(role: str) -> SemanticCache:
+    """
+    Get the semantic cache for an agent role, creating it on first use.
+
+    Each role (planner, writer, reviewer, ...) has its own cache, so a
+    planner response can never satisfy a writer lookup. Entries persist
+    under RESEARCH_CACHE_DIR/semantic/<role>.
+    """
+    cache_dir = os.getenv("RESEARCH_CACHE_DIR", "~/.cache/multi_agent_research")
+    store = diskcache.Cache(os.path.join(os.path.expanduser(cache_dir), "semantic", role))
+    return SemanticCache(store=store)
+
+
+async def cached_invoke(
+    chain: Any,
+    role: str,
+    inputs: dict[str, Any],
+    key: Optional[str] = None,
+    scope: str = "",
+    lookup: bool = True,
+) -> Any:
+    """
+    Invoke a chain, reusing the response of an earlier similar call.
+
+    The lookup embeds only the variable part of the prompt: each role's
+    template is fixed, and the embedding model truncates long inputs, so
+    the whole rendered prompt would mostly match on boilerplate.
+
+    Args:
+        chain: Runnable to call on a cache miss
+        role: Cache namespace, normally the agent name
+        inputs: Variables passed to chain.ainvoke
+        key: Text matched semantically (default: the joined input values)
+        scope: Text that must match exactly for a hit (e.g. the source URLs)
+        lookup: Set False to force a fresh call (the result is still stored)
+
+    Returns:
+        The cached or freshly generated chain output
+
+    Example:
+        >>> plan = await cached_invoke(chain, "planner", {"query": query})
+    """
+    cache = get_cache(role)
+    if key is None:
+        key = "\n".join(str(value) for value in inputs.values())
+
+    # Loading and running the embedding model is CPU-bound
+    embedding = await asyncio.to_thread(cache.embed, key)
+
+    if lookup:
+        cached = cache.lookup(embedding, scope=scope)
+        if cached is not None:
+            return cached
+
+    response = await chain.ainvoke(inputs)
+    cache.put(embedding, response, scope=scope)
+    return response
@@ -1,14 +1,31 @@
 """LangGraph workflow orchestration for multi-agent research."""
 
+import asyncio
+import hashlib
 import operator
-from typing import Annotated, Any
-
-from langchain.schema import AnyMessage, HumanMessage
-from langgraph.checkpoint.memory import MemorySaver
+import os
+import threading
+from functools import lru_cache
+from typing import Annotated, Any, AsyncIterator, Coroutine, Optional
+
+import diskcache
+from langchain_core.messages import AIMessageChunk, AnyMessage, HumanMessage
+from langgraph.checkpoint.base import BaseCheckpointSaver
 from langgraph.graph import END, StateGraph
 from typing_extensions import TypedDict
 
-from agents import planner_node, researcher_node, reviewer_node, writer_node
+from agents import (
+    SearchResults,
+    empty_results,
+    planner_node,
+    researcher_node,
+    reviewer_node,
+    writer_node,
+    writer_node_batch,
+)
+
+# Completed runs are replayed for identical requests within this window
+RUN_CACHE_TTL = 24 * 60 * 60
 
 
 class ResearchState(TypedDict):
@@ -19,28 +36,32 @@ class ResearchState(TypedDict):
         messages: Accumulated messages from agents
         query: User's research question
         plan: List of research steps
-        results: Search results with metadata
+        results: Search results as parallel lists (title, url, snippet, step_index)
         draft: Written brief with citations
         final: Approved final output
         references: Deduplicated URL list
         revised_once: Whether revision has occurred
+        needs_revision: Whether the reviewer sent the draft back to the writer
         llm_provider: LLM provider name
         model_name: Model identifier
         search_provider: Search provider name
         num_results: Results per search step
+        force_refresh: Bypass the search and LLM response caches
     """
     messages: Annotated[list[AnyMessage], operator.add]
     query: str
     plan: list[str]
-    results: list[dict]
+    results: SearchResults
     draft: str
     final: str
     references: list[str]
     revised_once: bool
+    needs_revision: bool
     llm_provider: str
     model_name: str
     search_provider: str
     num_results: int
+    force_refresh: bool
 
 
 def _should_revise(state: ResearchState) -> str:
@@ -53,18 +74,11 @@ def _should_revise(state: ResearchState) -> str:
     Returns:
         "writer" if revision needed and allowed, else END
     """
-    # If final is set, we're done
-    if state.get("final"):
-        return END
-
-    # If draft exists but not final, and not revised yet, go to writer
-    if state.get("draft") and not state.get("revised_once", False):
-        return "writer"
+    # The reviewer has already decided (and enforced the one-revision limit)
+    return "writer" if state.get("needs_revision") else END
 
-    return END
 
-
-def build_workflow() -> StateGraph:
+def build_workflow(checkpointer: Optional[BaseCheckpointSaver] = None) -> StateGraph:
     """
     Construct LangGraph workflow with agent nodes and edges.
 
@@ -74,6 +88,11 @@ def build_workflow() -> StateGraph:
                                          └──────────┘
                                       (revision loop)
 
+    Args:
+        checkpointer: Saver for resumable runs (e.g. MemorySaver). Without
+            one the state isn't serialized after every node; runs with one
+            must pass a thread_id in the config.
+
     Returns:
         Compiled StateGraph ready for execution
 
@@ -107,19 +126,206 @@ def build_workflow() -> StateGraph:
         },
     )
 
-    # Compile with checkpointer
-    return workflow.compile(checkpointer=MemorySaver())
+    return workflow.compile(checkpointer=checkpointer)
 
 
-def run_research(
+def _initial_state(
+    query: str,
+    llm_provider: str,
+    model_name: str,
+    search_provider: str,
+    num_results: int,
+    force_refresh: bool = False,
+) -> dict[str, Any]:
+    """Build the starting workflow state for a query."""
+    return {
+        "messages": [HumanMessage(content=query)],
+        "query": query,
+        "plan": [],
+        "results": empty_results(),
+        "draft": "",
+        "final": "",
+        "references": [],
+        "revised_once": False,
+        "needs_revision": False,
+        "llm_provider": llm_provider,
+        "model_name": model_name,
+        "search_provider": search_provider,
+        "num_results": max(1, min(num_results, 10)),
+        "force_refresh": force_refresh,
+    }
+
+
+def _apply_update(state: dict[str, Any], update: dict[str, Any]) -> None:
+    """Merge a node's update into state, appending messages like the graph does."""
+    for key, value in update.items():
+        if key == "messages":
+            state["messages"] = state.get("messages", []) + value
+        else:
+            state[key] = value
+
+
+@lru_cache(maxsize=1)
+def _run_cache() -> diskcache.Cache:
+    """Open the on-disk cache of completed runs (RESEARCH_CACHE_DIR)."""
+    cache_dir = os.getenv("RESEARCH_CACHE_DIR", "~/.cache/multi_agent_research")
+    return diskcache.Cache(os.path.join(os.path.expanduser(cache_dir), "runs"))
+
+
+def _run_cache_key(state: dict[str, Any]) -> str:
+    """Stable key for a run's inputs (normalized query + provider settings)."""
+    raw = "|".join([
+        state["query"].strip().lower(),
+        state["llm_provider"],
+        state["model_name"],
+        state["search_provider"],
+        str(state["num_results"]),
+    ])
+    return hashlib.blake2b(raw.encode(), digest_size=16).hexdigest()
+
+
+@lru_cache(maxsize=1)
+def _event_loop() -> asyncio.AbstractEventLoop:
+    """Start the background event loop that runs the synchronous entry points."""
+    loop = asyncio.new_event_loop()
+    threading.Thread(target=loop.run_forever, daemon=True).start()
+    return loop
+
+
+def _run_sync(coro: Coroutine[Any, Any, Any]) -> Any:
+    """
+    Run a coroutine to completion from synchronous code.
+
+    Every call shares one long-lived loop (rather than asyncio.run per call)
+    so the LLM clients' pooled async connections stay bound to a live loop.
+    """
+    return asyncio.run_coroutine_threadsafe(coro, _event_loop()).result()
+
+
+def _chunk_text(message: Any) -> str:
+    """Extract the text of a streamed message chunk (string or content blocks)."""
+    content = message.content
+    if isinstance(content, str):
+        return content
+
+    return "".join(
+        block.get("text", "") for block in content
+        if isinstance(block, dict) and block.get("type") == "text"
+    )
+
+
+async def stream_research(
+    query: str,
+    llm_provider: str = "anthropic",
+    model_name: str = "claude-sonnet-4-5-20250929",
+    search_provider: str = "duckduckgo",
+    num_results: int = 5,
+    force_refresh: bool = False,
+    checkpointer: Optional[BaseCheckpointSaver] = None,
+) -> AsyncIterator[dict[str, Any]]:
+    """
+    Execute the research workflow, yielding the state as it progresses.
+
+    A state is yielded after every agent finishes and after every token the
+    writer streams, with the partial brief in "draft", so callers can render
+    the brief while it is still being generated.
+
+    Completed runs are cached on disk for RUN_CACHE_TTL seconds; repeating
+    the same query with the same settings yields the stored final state
+    immediately instead of re-running every agent.
+
+    Args:
+        query: Research question to investigate
+        llm_provider: LLM provider ('anthropic', 'openai', 'ollama', 'custom')
+        model_name: Model identifier
+        search_provider: Search provider ('duckduckgo', 'brave', 'serper')
+        num_results: Results per search step (1-10)
+        force_refresh: Ignore cached runs, searches and LLM responses and
+            research from scratch
+        checkpointer: Saver to checkpoint the run with. Threads are keyed
+            like the run cache (query and settings), so with a persistent
+            saver (e.g. SqliteSaver) a later process resumes an interrupted
+            run where it stopped, or replays a finished one. Forced
+            refreshes are not checkpointed
+
+    Yields:
+        Accumulated state dicts (see run_research); the last one is final
+
+    Example:
+        >>> async for state in stream_research("impact of quantum computing"):
+        ...     print(state["draft"])
+    """
+    # A forced refresh must not resume or replay an earlier thread
+    if force_refresh:
+        checkpointer = None
+
+    # Build graph
+    graph = build_workflow(checkpointer)
+
+    # Prepare initial state
+    state = _initial_state(
+        query, llm_provider, model_name, search_provider, num_results, force_refresh
+    )
+
+    cache_key = _run_cache_key(state)
+    if not force_refresh:
+        cached_state = _run_cache().get(cache_key)
+        if cached_state is not None:
+            yield cached_state
+            return
+
+    # Execute workflow (a thread id is only meaningful with a checkpointer)
+    config = None
+    run_input = state
+    if checkpointer is not None:
+        config = {"configurable": {"thread_id": f"research_{cache_key}"}}
+        snapshot = await graph.aget_state(config)
+        if snapshot.values and not snapshot.next:
+            # This request already ran to completion on this thread
+            yield dict(snapshot.values)
+            return
+        if snapshot.next:
+            # Resume the interrupted run; fresh input would restart it and
+            # append a second copy of its messages
+            state = dict(snapshot.values)
+            run_input = None
+
+    partial_draft = ""
+    async for mode, chunk in graph.astream(
+        run_input, config, stream_mode=["updates", "messages"]
+    ):
+        if mode == "messages":
+            message, metadata = chunk
+            # Only token chunks streamed by the writer's LLM call
+            if metadata.get("langgraph_node") == "writer" and isinstance(message, AIMessageChunk):
+                partial_draft += _chunk_text(message)
+                yield {**state, "draft": partial_draft}
+            continue
+
+        for update in chunk.values():
+            _apply_update(state, update or {})
+        partial_draft = ""
+        yield state
+
+    # Only cache briefs that were actually written from sources
+    if state.get("final") and state.get("references"):
+        _run_cache().set(cache_key, state, expire=RUN_CACHE_TTL)
+
+
+async def arun_research(
     query: str,
     llm_provider: str = "anthropic",
     model_name: str = "claude-sonnet-4-5-20250929",
     search_provider: str = "duckduckgo",
     num_results: int = 5,
+    force_refresh: bool = False,
+    checkpointer: Optional[BaseCheckpointSaver] = None,
 ) -> dict[str, Any]:
     """
-    Execute complete research workflow for a query.
+    Execute complete research workflow for a query (async).
+
+    Repeat runs with the same query and settings are served from the
+    on-disk run cache (see stream_research).
 
     Args:
         query: Research question to investigate
@@ -127,11 +333,13 @@ def run_research(
         model_name: Model identifier
         search_provider: Search provider ('duckduckgo', 'brave', 'serper')
         num_results: Results per search step (1-10)
+        force_refresh: Ignore any cached run and research from scratch
+        checkpointer: Saver to checkpoint the run with, for resuming it later
 
     Returns:
         Final state dict containing:
             - plan: Research steps taken
-            - results: Search results found
+            - results: Search results found (parallel lists by field)
             - final: Final brief with citations
             - references: List of source URLs
             - messages: Agent messages
@@ -141,40 +349,171 @@ def run_research(
         Exception: If workflow execution fails
 
     Example:
-        >>> result = run_research(
+        >>> result = await arun_research(
         ...     "impact of quantum computing",
         ...     llm_provider="ollama",
         ...     model_name="llama3.1:70b"
         ... )
         >>> print(result["final"])
     """
-    # Build graph
-    graph = build_workflow()
-
-    # Prepare initial state
-    initial_state = {
-        "messages": [HumanMessage(content=query)],
-        "query": query,
-        "plan": [],
-        "results": [],
-        "draft": "",
-        "final": "",
-        "references": [],
-        "revised_once": False,
-        "llm_provider": llm_provider,
-        "model_name": model_name,
-        "search_provider": search_provider,
-        "num_results": max(1, min(num_results, 10)),
-    }
-
-    # Execute workflow
-    config = {"configurable": {"thread_id": f"research_{hash(query)}"}}
-
     final_state = None
-    for state_update in graph.stream(initial_state, config):
-        final_state = list(state_update.values())[0]
+    async for final_state in stream_research(
+        query, llm_provider, model_name, search_provider, num_results,
+        force_refresh, checkpointer,
+    ):
+        pass
 
     if not final_state:
         raise RuntimeError("Workflow produced no output")
 
     return final_state
+
+
+def run_research(
+    query: str,
+    llm_provider: str = "anthropic",
+    model_name: str = "claude-sonnet-4-5-20250929",
+    search_provider: str = "duckduckgo",
+    num_results: int = 5,
+    force_refresh: bool = False,
+    checkpointer: Optional[BaseCheckpointSaver] = None,
+) -> dict[str, Any]:
+    """
+    Execute complete research workflow for a query.
+
+    Synchronous wrapper around arun_research for scripts and the CLI.
+
+    Args:
+        query: Research question to investigate
+        llm_provider: LLM provider ('anthropic', 'openai', 'ollama', 'custom')
+        model_name: Model identifier
+        search_provider: Search provider ('duckduckgo', 'brave', 'serper')
+        num_results: Results per search step (1-10)
+        force_refresh: Ignore any cached run and research from scratch
+        checkpointer: Saver to checkpoint the run with, for resuming it later
+
+    Returns:
+        Final state dict (see arun_research)
+
+    Example:
+        >>> result = run_research(
+        ...     "impact of quantum computing",
+        ...     llm_provider="ollama",
+        ...     model_name="llama3.1:70b"
+        ... )
+        >>> print(result["final"])
+    """
+    return _run_sync(arun_research(
+        query, llm_provider, model_name, search_provider, num_results,
+        force_refresh, checkpointer,
+    ))
+
+
+async def arun_research_batch(
+    queries: list[str],
+    llm_provider: str = "anthropic",
+    model_name: str = "claude-sonnet-4-5-20250929",
+    search_provider: str = "duckduckgo",
+    num_results: int = 5,
+    batch_size: int = 4,
+    delay_between_batches: float = 0.0,
+) -> list[dict[str, Any]]:
+    """
+    Execute the research workflow for several queries, batching the writer.
+
+    Planning and searching run per query, concurrently across queries.
+    Briefs are then drafted batch_size queries per LLM request via
+    writer_node_batch, after which each brief is reviewed (with the usual
+    single revision) individually.
+
+    Args:
+        queries: Research questions to investigate
+        llm_provider: LLM provider ('anthropic', 'openai', 'ollama', 'custom')
+        model_name: Model identifier
+        search_provider: Search provider ('duckduckgo', 'brave', 'serper')
+        num_results: Results per search step (1-10)
+        batch_size: Queries drafted per writer LLM call
+        delay_between_batches: Seconds to pause between writer batches
+
+    Returns:
+        Final state dict per query, in input order (see run_research)
+
+    Example:
+        >>> results = await arun_research_batch(
+        ...     ["fusion energy progress", "AI safety research"],
+        ...     llm_provider="ollama",
+        ...     model_name="llama3.1:70b",
+        ... )
+        >>> [r["final"] for r in results]
+    """
+    states = [
+        _initial_state(query, llm_provider, model_name, search_provider, num_results)
+        for query in queries
+    ]
+
+    async def prepare(state: dict[str, Any]) -> None:
+        _apply_update(state, await planner_node(state))
+        # The researcher is synchronous (it fans out on its own thread pool)
+        _apply_update(state, await asyncio.to_thread(researcher_node, state))
+
+    async def review(state: dict[str, Any]) -> None:
+        # Follows the graph's revision loop
+        _apply_update(state, await reviewer_node(state))
+        if _should_revise(state) == "writer":
+            _apply_update(state, await writer_node(state))
+            _apply_update(state, await reviewer_node(state))
+
+    await asyncio.gather(*(prepare(state) for state in states))
+
+    batch_size = max(1, batch_size)
+    for start in range(0, len(states), batch_size):
+        if start and delay_between_batches > 0:
+            await asyncio.sleep(delay_between_batches)
+
+        batch = states[start:start + batch_size]
+        for state, update in zip(batch, await writer_node_batch(batch)):
+            _apply_update(state, update)
+
+        await asyncio.gather(*(review(state) for state in batch))
+
+    return states
+
+
+def run_research_batch(
+    queries: list[str],
+    llm_provider: str = "anthropic",
+    model_name: str = "claude-sonnet-4-5-20250929",
+    search_provider: str = "duckduckgo",
+    num_results: int = 5,
+    batch_size: int = 4,
+    delay_between_batches: float = 0.0,
+) -> list[dict[str, Any]]:
+    """
+    Execute the research workflow for several queries, batching the writer.
+
+    Synchronous wrapper around arun_research_batch.
+
+    Args:
+        queries: Research questions to investigate
+        llm_provider: LLM provider ('anthropic', 'openai', 'ollama', 'custom')
+        model_name: Model identifier
+        search_provider: Search provider ('duckduckgo', 'brave', 'serper')
+        num_results: Results per search step (1-10)
+        batch_size: Queries drafted per writer LLM call
+        delay_between_batches: Seconds to pause between writer batches
+
+    Returns:
+        Final state dict per query, in input order (see run_research)
+
+    Example:
+        >>> results = run_research_batch(
+        ...     ["fusion energy progress", "AI safety research"],
+        ...     llm_provider="ollama",
+        ...     model_name="llama3.1:70b",
+        ... )
+        >>> [r["final"] for r in results]
+    """
+    return _run_sync(arun_research_batch(
+        queries, llm_provider, model_name, search_provider, num_results,
+        batch_size, delay_between_batches,
+    ))